@@ -334,6 +334,7 @@ from importlib.util import find_spec
 not_installed = {
     pkg_name: find_spec(pkg_name) is None
     for pkg_name in [
+        'numpy',
         'uncertainties',
         'serialize',
     ]
@@ -25,8 +25,10 @@ from .errors import (  # noqa: F401
 )
 from .formatting import formatter
 from .measurement import Measurement
-from .quantity import Quantity
+from .mixed import MixedUnitArray
+from .quantity import Quantity, QuantityBatch
 from .registry import LazyRegistry, UnitRegistry
+from .shared import SharedQuantity, SharedQuantityHandle
 from .unit import Unit
 from .util import logger, pi_theorem
 
@@ -79,16 +81,56 @@ def _unpickle(cls, *args):
     from .unit import UnitsContainer
 
     for arg in args:
-        # Prefixed units are defined within the registry
-        # on parsing (which does not happen here).
-        # We need to make sure that this happens before using.
         if isinstance(arg, UnitsContainer):
-            for name in arg:
-                _APP_REGISTRY.parse_units(name)
+            _define_unit_names(arg)
 
     return cls(*args)
 
 
+def _unpickle_batch(cls, units, codes, magnitudes):
+    """Rebuild a QuantityBatch upon unpickling.
+    All units must exist in the application registry.
+
+    Parameters
+    ----------
+    cls : QuantityBatch
+    units : list of UnitsContainer
+        Table of the units of the quantities.
+    codes : list of int
+        Index in `units` of the units of each quantity.
+    magnitudes : list
+        Magnitude of each quantity.
+
+    Returns
+    -------
+    object of type cls
+
+    """
+    for u in units:
+        _define_unit_names(u)
+
+    units = [u.intern() for u in units]
+    from_trusted = Quantity._from_trusted
+    return cls(from_trusted(m, units[c]) for m, c in zip(magnitudes, codes))
+
+
+def _define_unit_names(units):
+    """Make sure that the unit names of a UnitsContainer exist in the application
+    registry, parsing only the names that it does not know yet.
+
+    Parameters
+    ----------
+    units : UnitsContainer
+    """
+    # Prefixed units are defined within the registry
+    # on parsing (which does not happen here).
+    # We need to make sure that this happens before using.
+    known = _APP_REGISTRY._units
+    for name in units:
+        if name not in known:
+            _APP_REGISTRY.parse_units(name)
+
+
 def set_application_registry(registry):
     """Set the application registry, which is used for unpickling operations
     and when invoking pint.Quantity or pint.Unit directly.
@@ -134,7 +176,11 @@ def test():
 __all__ = (
     "Context",
     "Measurement",
+    "MixedUnitArray",
     "Quantity",
+    "QuantityBatch",
+    "SharedQuantity",
+    "SharedQuantityHandle",
     "Unit",
     "UnitRegistry",
     "DefinitionSyntaxError",
@@ -127,6 +127,15 @@ try:
 except ImportError:
     HAS_BABEL = False
 
+try:
+    from multiprocessing import shared_memory
+
+    HAS_SHARED_MEMORY = True
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+    HAS_SHARED_MEMORY = False
+
 # Defines Logarithm and Exponential for Logarithmic Converter
 if HAS_NUMPY:
     from numpy import exp  # noqa: F401
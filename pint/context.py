@@ -8,6 +8,7 @@
     :license: BSD, see LICENSE for more details.
 """
 
+import functools
 import re
 import weakref
 from collections import ChainMap, defaultdict
@@ -25,11 +26,14 @@ _header_re = re.compile(
 _varname_re = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
 
-def _expression_to_function(eq):
-    def func(ureg, value, **kwargs):
-        return ureg.parse_expression(eq, value=value, **kwargs)
+def _evaluate_expression(eq, ureg, value, **kwargs):
+    return ureg.parse_expression(eq, value=value, **kwargs)
+
 
-    return func
+def _expression_to_function(eq):
+    # A partial of a module level function (rather than a closure) can be pickled,
+    # which allows registries to store their contexts in a snapshot.
+    return functools.partial(_evaluate_expression, eq)
 
 
 class Context:
@@ -223,6 +227,18 @@ class Context:
 
         return ctx
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # WeakValueDictionary cannot be pickled; it is rebuilt from funcs.
+        del state["relation_to_context"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.relation_to_context = weakref.WeakValueDictionary()
+        for edge in self.funcs:
+            self.relation_to_context[edge] = self
+
     def add_transformation(self, src, dst, func):
         """Add a transformation function to the context.
         """
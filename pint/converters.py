@@ -8,8 +8,10 @@
     :license: BSD, see LICENSE for more details.
 """
 
+from decimal import Decimal
+from fractions import Fraction
 
-from .compat import HAS_NUMPY, exp, log  # noqa: F401
+from .compat import HAS_NUMPY, exp, log, np  # noqa: F401
 
 
 class Converter:
@@ -159,3 +161,187 @@ class LogarithmicConverter(Converter):
             value = self.scale * exp(log(self.logbase) * (value / self.logfactor))
 
         return value
+
+
+def convert_with_plan(value, plan, inplace=False):
+    """Convert value following a conversion plan.
+
+    Parameters
+    ----------
+    value :
+        magnitude to convert.
+    plan : tuple
+        (src_converter, factor, dst_converter), as built by
+        BaseRegistry._build_conversion_plan.
+    inplace : bool
+        controls if computation is done in place. (Default value = False)
+
+    Returns
+    -------
+    converted value
+    """
+    src_converter, factor, dst_converter = plan
+
+    if src_converter is not None:
+        value = src_converter.to_reference(value, inplace)
+
+    # factor is type float and if our magnitude is type Decimal then
+    # must first convert to Decimal before we can '*' the values
+    if isinstance(value, Decimal):
+        factor = Decimal(str(factor))
+    elif isinstance(value, Fraction):
+        factor = Fraction(str(factor))
+
+    if inplace:
+        value *= factor
+    else:
+        value = value * factor
+
+    if dst_converter is not None:
+        value = dst_converter.from_reference(value, inplace)
+
+    return value
+
+
+def _affine_coefficients(converter):
+    """Return the (scale, offset) of a converter of a conversion plan,
+    or None if it is not affine.
+    """
+    if converter is None:
+        return 1, 0
+    elif isinstance(converter, (ScaleConverter, OffsetConverter)):
+        return converter.scale, getattr(converter, "offset", 0)
+    return None
+
+
+class CompiledConverter:
+    """A callable converting magnitudes between two fixed units,
+    as returned by :meth:`UnitRegistry.get_converter`.
+
+    Affine conversions (including those between offset units) are reduced to a
+    single scale and offset; other ones (e.g. logarithmic) apply the converters
+    of the units in sequence.
+
+    Parameters
+    ----------
+    src : UnitsContainer
+        source units.
+    dst : UnitsContainer
+        destination units.
+    plan : tuple
+        (src_converter, factor, dst_converter)
+    """
+
+    def __init__(self, src, dst, plan):
+        self.src = src
+        self.dst = dst
+        self.plan = plan
+
+        src_converter, factor, dst_converter = plan
+        src_coefs = _affine_coefficients(src_converter)
+        dst_coefs = _affine_coefficients(dst_converter)
+        if factor is None or src_coefs is None or dst_coefs is None:
+            self.scale = self.offset = None
+        else:
+            (src_scale, src_offset), (dst_scale, dst_offset) = src_coefs, dst_coefs
+            self.scale = src_scale * factor / dst_scale
+            self.offset = (src_offset * factor - dst_offset) / dst_scale
+
+    def __repr__(self):
+        return "<CompiledConverter('{}' -> '{}')>".format(self.src, self.dst)
+
+    def __call__(self, value, inplace=False, out=None):
+        """Convert a magnitude.
+
+        Parameters
+        ----------
+        value : number or array
+            magnitude in source units.
+        inplace : bool
+            if True, value (which must be a mutable array) is modified and
+            returned. (Default value = False)
+        out : array, optional
+            array where the result is stored and returned. (Default value = None)
+
+        Returns
+        -------
+        converted value
+        """
+        if out is not None:
+            out[...] = value
+            value = out
+            inplace = True
+
+        scale = self.scale
+        if scale is None or isinstance(value, (Decimal, Fraction)):
+            return convert_with_plan(value, self.plan, inplace)
+
+        offset = self.offset
+        if inplace:
+            value *= scale
+            if offset:
+                value += offset
+            return value
+
+        if offset:
+            return value * scale + offset
+        return value * scale
+
+
+def convert_stream(iterable, converter, chunk_size=None, inplace=False):
+    """Convert the magnitudes pulled from an iterable, yielding converted chunks.
+
+    Parameters
+    ----------
+    iterable :
+        numbers or arrays, in source units.
+    converter : callable
+        taking a magnitude and an `inplace` argument, like CompiledConverter.
+    chunk_size : int, optional
+        if given, consecutive numbers are gathered in arrays of this size,
+        converted and yielded together. Arrays are converted one by one.
+        (Default value = None, converting each number on its own)
+    inplace : bool
+        if True, arrays pulled from the iterable are converted in place when
+        their dtype allows it. Arrays gathered from numbers always are.
+        (Default value = False)
+
+    Yields
+    ------
+    converted number or array
+    """
+    buffer = []
+    for value in iterable:
+        if chunk_size is None:
+            yield converter(value, inplace=inplace and _is_inplace_safe(value))
+        elif getattr(value, "ndim", 0):
+            if buffer:
+                yield _convert_buffer(buffer, converter)
+                buffer = []
+            yield converter(value, inplace=inplace and _is_inplace_safe(value))
+        else:
+            buffer.append(value)
+            if len(buffer) == chunk_size:
+                yield _convert_buffer(buffer, converter)
+                buffer = []
+
+    if buffer:
+        yield _convert_buffer(buffer, converter)
+
+
+def _convert_buffer(buffer, converter):
+    chunk = np.array(buffer)
+    return converter(chunk, inplace=_is_inplace_safe(chunk))
+
+
+def _is_inplace_safe(value):
+    """Return True if value is an array that can store the result of a
+    conversion, i.e. a writeable array of floating point or complex numbers.
+    """
+    return (
+        HAS_NUMPY
+        and isinstance(value, np.ndarray)
+        and value.ndim > 0
+        and value.dtype.kind in "fc"
+        and value.flags.writeable
+    )
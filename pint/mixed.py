@@ -0,0 +1,196 @@
+"""
+    pint.mixed
+    ~~~~~~~~~~
+
+    :copyright: 2016 by Pint Authors, see AUTHORS for more details.
+    :license: BSD, see LICENSE for more details.
+"""
+
+import copy
+
+from .compat import HAS_NUMPY, np
+from .errors import DimensionalityError
+from .util import SharedRegistryObject, to_units_container
+
+
+class MixedUnitArray(SharedRegistryObject):
+    """Implements an array of magnitudes of the same dimensionality, each one
+    expressed in its own unit.
+
+    The units of the elements are stored as small integer codes indexing a table
+    of units, so that converting the whole array to a single unit only gathers
+    one scale and offset per element.
+
+    Parameters
+    ----------
+    magnitudes : array_like
+        Magnitudes of the elements. Masked arrays are supported.
+    codes : array_like of int
+        Index in `units` of the units of each element, with the shape of
+        `magnitudes`.
+    units : sequence of str, UnitsContainer, pint.Unit or pint.Quantity
+        Table of the units of the elements, which must have the same
+        dimensionality.
+
+    """
+
+    def __init__(self, magnitudes, codes, units):
+        if not HAS_NUMPY:
+            raise RuntimeError("Pint requires NumPy to create a MixedUnitArray object.")
+
+        magnitudes = np.asanyarray(magnitudes)
+        codes = np.asarray(codes)
+        if codes.shape != magnitudes.shape:
+            raise ValueError(
+                "codes must have the shape of the magnitudes, {} != {}".format(
+                    codes.shape, magnitudes.shape
+                )
+            )
+        if codes.dtype.kind not in "iu":
+            raise TypeError("codes must be integers, not {}".format(codes.dtype))
+
+        units = tuple(to_units_container(u, self._REGISTRY).intern() for u in units)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(units)):
+            raise ValueError("codes must be between 0 and {}".format(len(units) - 1))
+
+        get_vector = self._REGISTRY._get_dimensionality_vector
+        for u in units[1:]:
+            if get_vector(u) != get_vector(units[0]):
+                raise DimensionalityError(
+                    units[0],
+                    u,
+                    self._REGISTRY._get_dimensionality(units[0]),
+                    self._REGISTRY._get_dimensionality(u),
+                )
+
+        self._magnitudes = magnitudes
+        self._codes = codes
+        self._units = units
+
+    @classmethod
+    def from_quantities(cls, seq):
+        """Build a MixedUnitArray from a sequence of scalar quantities, keeping the
+        units of each one.
+
+        Parameters
+        ----------
+        seq : sequence of pint.Quantity
+
+        Returns
+        -------
+        MixedUnitArray
+        """
+        table = {}
+        codes = [table.setdefault(q._units, len(table)) for q in seq]
+        return cls(
+            [q._magnitude for q in seq],
+            np.array(codes, dtype=np.min_scalar_type(max(len(table) - 1, 0))),
+            tuple(table),
+        )
+
+    def __repr__(self):
+        return "<MixedUnitArray({}, {}, {})>".format(
+            self._magnitudes, self._codes, [str(u) for u in self._units]
+        )
+
+    def __len__(self):
+        return len(self._magnitudes)
+
+    @property
+    def magnitude(self):
+        """Magnitudes of the elements, each one in its own unit."""
+        return self._magnitudes
+
+    m = magnitude
+
+    @property
+    def codes(self):
+        """Index in :attr:`units` of the units of each element."""
+        return self._codes
+
+    @property
+    def units(self):
+        """Table of the units of the elements."""
+        return tuple(self._REGISTRY.Unit(u) for u in self._units)
+
+    @property
+    def shape(self):
+        return self._magnitudes.shape
+
+    @property
+    def dimensionality(self):
+        """Dimensionality shared by all the elements."""
+        if not self._units:
+            return self._REGISTRY.UnitsContainer()
+        return self._REGISTRY._get_dimensionality(self._units[0])
+
+    def __getitem__(self, key):
+        magnitude = self._magnitudes[key]
+        code = self._codes[key]
+        if np.ndim(code) == 0:
+            if magnitude is np.ma.masked:
+                return magnitude
+            return self._REGISTRY.Quantity(magnitude, self._units[code])
+
+        # Slices and masks share the table of units
+        new = copy.copy(self)
+        new._magnitudes = magnitude
+        new._codes = code
+        return new
+
+    def m_as(self, units):
+        """Convert all the elements to the same unit and return the magnitudes.
+
+        Parameters
+        ----------
+        units : str, UnitsContainer, pint.Unit or pint.Quantity
+            destination units.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        registry = self._REGISTRY
+        dst = to_units_container(units, registry)
+        converters = [registry.get_converter(src, dst) for src in self._units]
+
+        scale = np.array(
+            [1 if c.scale is None else c.scale for c in converters], dtype=float
+        )
+        offset = np.array(
+            [0 if c.offset is None else c.offset for c in converters], dtype=float
+        )
+        result = self._magnitudes * np.take(scale, self._codes)
+        result += np.take(offset, self._codes)
+
+        # Conversions that are not affine, e.g. to or from logarithmic units
+        for code, converter in enumerate(converters):
+            if converter.scale is None:
+                selected = self._codes == code
+                result[selected] = converter(self._magnitudes[selected])
+
+        return result
+
+    def to(self, units):
+        """Convert all the elements to the same unit.
+
+        Parameters
+        ----------
+        units : str, UnitsContainer, pint.Unit or pint.Quantity
+            destination units.
+
+        Returns
+        -------
+        pint.Quantity
+        """
+        return self._REGISTRY.Quantity(self.m_as(units), units)
+
+
+def build_mixed_unit_array_class(registry):
+    class MixedUnitArray(_MixedUnitArray):
+        _REGISTRY = registry
+
+    return MixedUnitArray
+
+
+_MixedUnitArray = MixedUnitArray
@@ -123,6 +123,34 @@ def unwrap_and_wrap_consistent_units(*args):
     if all(not _is_quantity(arg) for arg in args):
         return args, lambda x: x
 
+    signature = _dispatch_signature(args, {}, False)
+    if signature is not None:
+        markers, registry = signature
+        cache = registry._cache.numpy_dispatch
+        key = ("consistent", None, markers)
+        try:
+            converters, first_input_units = cache[key]
+        except KeyError:
+            first_input_units = _get_first_input_units(args)
+            try:
+                converters = _get_converters(
+                    registry, markers[2], first_input_units._units
+                )
+            except Exception:
+                # The slow path raises the appropriate error
+                converters = None
+            else:
+                cache[key] = converters, first_input_units
+        if converters is not None:
+            Quantity = registry.Quantity
+            return (
+                tuple(
+                    arg if convert is None else convert(arg)
+                    for arg, convert in zip(args, converters)
+                ),
+                lambda value: _wrap_output(value, first_input_units, Quantity),
+            )
+
     first_input_units = _get_first_input_units(args)
     args, _ = convert_to_consistent_units(*args, pre_calc_units=first_input_units)
     return (
@@ -272,6 +300,24 @@ def implement_func(func_type, func_str, input_units=None, output_unit=None):
 
     @implements(func_str, func_type)
     def implementation(*args, **kwargs):
+        signature = _dispatch_signature(args, kwargs, input_units is None)
+        if signature is not None:
+            registry = signature[1]
+            cache = registry._cache.numpy_dispatch
+            key = (func_type, func_str, signature[0])
+            try:
+                converters, result_unit = cache[key]
+            except KeyError:
+                entry = _build_dispatch_entry(
+                    args, kwargs, input_units, output_unit, signature[0]
+                )
+                if entry is not None:
+                    cache[key] = entry
+            else:
+                return _dispatch(
+                    func, args, kwargs, converters, output_unit, result_unit, registry
+                )
+
         first_input_units = _get_first_input_units(args, kwargs)
         if input_units == "all_consistent":
             # Match all input args/kwargs to same units
@@ -297,28 +343,156 @@ def implement_func(func_type, func_str, input_units=None, output_unit=None):
         if output_unit is None:
             # Short circuit and return magnitude alone
             return result_magnitude
-        elif output_unit == "match_input":
-            result_unit = first_input_units
-        elif output_unit in [
-            "sum",
-            "mul",
-            "delta",
-            "delta,div",
-            "div",
-            "variance",
-            "square",
-            "sqrt",
-            "cbrt",
-            "reciprocal",
-            "size",
-        ]:
-            result_unit = get_op_output_unit(
-                output_unit, first_input_units, tuple(chain(args, kwargs.values()))
+        result_unit = _get_output_unit(output_unit, first_input_units, args, kwargs)
+        return _wrap_output(
+            result_magnitude, result_unit, first_input_units._REGISTRY.Quantity
+        )
+
+
+def _get_output_unit(output_unit, first_input_units, args, kwargs):
+    """Return the unit of the output of an implementation added by implement_func,
+    as a pint.Unit or a str.
+    """
+    if output_unit == "match_input":
+        return first_input_units
+    elif output_unit in [
+        "sum",
+        "mul",
+        "delta",
+        "delta,div",
+        "div",
+        "variance",
+        "square",
+        "sqrt",
+        "cbrt",
+        "reciprocal",
+        "size",
+    ]:
+        return get_op_output_unit(
+            output_unit, first_input_units, tuple(chain(args, kwargs.values()))
+        )
+    return output_unit
+
+
+def _wrap_output(result_magnitude, result_unit, Quantity):
+    if isinstance(result_unit, str) or isinstance(result_magnitude, (list, tuple)):
+        return Quantity(result_magnitude, result_unit)
+    return Quantity._from_trusted(result_magnitude, result_unit._units)
+
+
+#: Types of the arguments that are passed unchanged to NumPy when units are stripped,
+#: and don't change the unit of the output.
+_PLAIN_TYPES = frozenset((int, float, complex, bool, str, type(None)))
+
+
+def _dispatch_signature(args, kwargs, strip_only):
+    """Return the unit signature of the arguments of a NumPy function, with the
+    registry of the first Quantity.
+
+    The signature holds the UnitsContainer of each Quantity argument, and None for
+    other arguments, which must be None unless units are only stripped. None is
+    returned instead if the handling of an argument may depend on its value, e.g.
+    sequences of quantities, or if there is no Quantity.
+    """
+    registry = None
+    markers = []
+    for arg in chain(args, kwargs.values()):
+        if _is_quantity(arg):
+            if registry is None:
+                registry = arg._REGISTRY
+            markers.append(arg._units)
+        elif arg is None or (
+            strip_only
+            and (
+                type(arg) in _PLAIN_TYPES
+                or (type(arg) is np.ndarray and not arg.dtype.hasobject)
             )
+        ):
+            markers.append(None)
         else:
-            result_unit = output_unit
+            return None
+    if registry is None:
+        return None
+    return (len(args), tuple(kwargs), tuple(markers)), registry
 
-        return first_input_units._REGISTRY.Quantity(result_magnitude, result_unit)
+
+def _build_dispatch_entry(args, kwargs, input_units, output_unit, signature):
+    """Resolve the conversion of each argument and the unit of the output of an
+    implementation added by implement_func, for a unit signature.
+
+    Returns
+    -------
+    tuple or None
+        a converter for each argument (None for arguments passed unchanged), and
+        the unit of the output; or None if the conversions can't be resolved
+        from the units alone, e.g. because they need a context.
+    """
+    first_input_units = _get_first_input_units(args, kwargs)
+    registry = first_input_units._REGISTRY
+    if input_units == "all_consistent":
+        pre_calc_units = first_input_units._units
+    elif input_units is None:
+        pre_calc_units = None
+    else:
+        pre_calc_units = registry.parse_units(input_units)._units
+
+    try:
+        converters = _get_converters(registry, signature[2], pre_calc_units)
+        if output_unit is None:
+            result_unit = None
+        else:
+            result_unit = _get_output_unit(output_unit, first_input_units, args, kwargs)
+    except Exception:
+        # The slow path raises the appropriate error, or uses the active contexts
+        return None
+    return converters, result_unit
+
+
+def _get_converters(registry, markers, pre_calc_units):
+    """Return a callable for each Quantity in a unit signature, returning its
+    magnitude in pre_calc_units (or as is if None), and None for other arguments.
+    """
+    converters = []
+    for units in markers:
+        if units is None:
+            converters.append(None)
+        elif pre_calc_units is None or units == pre_calc_units:
+            converters.append(_magnitude)
+        else:
+            converters.append(
+                _magnitude_converter(registry.get_converter(units, pre_calc_units))
+            )
+    return tuple(converters)
+
+
+def _magnitude(q):
+    return q._magnitude
+
+
+def _magnitude_converter(converter):
+    def convert(q):
+        return converter(q._magnitude)
+
+    return convert
+
+
+def _dispatch(func, args, kwargs, converters, output_unit, result_unit, registry):
+    """Call func on the magnitudes of the arguments, converted by the cached
+    converters, and wrap the result in the cached output unit.
+    """
+    nargs = len(args)
+    stripped_args = [
+        arg if convert is None else convert(arg)
+        for arg, convert in zip(args, converters)
+    ]
+    stripped_kwargs = {
+        key: arg if convert is None else convert(arg)
+        for (key, arg), convert in zip(kwargs.items(), converters[nargs:])
+    }
+    result_magnitude = func(*stripped_args, **stripped_kwargs)
+    if output_unit is None:
+        return result_magnitude
+    return _wrap_output(result_magnitude, result_unit, registry.Quantity)
 
 
 """
@@ -647,8 +821,8 @@ def _pad(array, pad_width, mode="constant", **kwargs):
         if key in kwargs:
             kwargs[key] = _recursive_convert(kwargs[key], units)
 
-    return units._REGISTRY.Quantity(
-        np.pad(array._magnitude, pad_width, mode=mode, **kwargs), units
+    return units._REGISTRY.Quantity._from_trusted(
+        np.pad(array._magnitude, pad_width, mode=mode, **kwargs), units._units
     )
 
 
@@ -697,7 +871,7 @@ def _prod(a, *args, **kwargs):
 
     result = np.prod(a._magnitude, *args, **kwargs)
 
-    return registry.Quantity(result, units)
+    return registry.Quantity._from_trusted(result, units._units)
 
 
 # Implement simple matching-unit or stripped-unit functions based on signature
@@ -809,12 +983,16 @@ def implement_atleast_nd(func_str):
             return [
                 array_magnitude
                 if not hasattr(original, "_REGISTRY")
-                else original._REGISTRY.Quantity(array_magnitude, original.units)
+                else original._REGISTRY.Quantity._from_trusted(
+                    array_magnitude, original._units
+                )
                 for array_magnitude, original in zip(arrays_magnitude, arrays)
             ]
         else:
             output_unit = arrays[0].units
-            return output_unit._REGISTRY.Quantity(arrays_magnitude, output_unit)
+            return output_unit._REGISTRY.Quantity._from_trusted(
+                arrays_magnitude, output_unit._units
+            )
 
 
 for func_str in ["atleast_1d", "atleast_2d", "atleast_3d"]:
@@ -101,6 +101,96 @@ class EvalTreeNode:
             # single value
             return define_op(self.left)
 
+    def compile(
+        self, define_op, variables, define_variable=None, bin_op=None, un_op=None
+    ):
+        """Pre-evaluate node into a function of the values of some variables.
+
+        Tokens naming a variable are looked up when the function is called, all the
+        other tokens are translated with define_op once, and the operations that do
+        not depend on any variable are evaluated once.
+
+        Parameters
+        ----------
+        define_op : callable
+            Translates tokens into objects.
+        variables : collection of str
+            Names of the variables.
+        define_variable : callable or None, optional
+            Translates the name and the value of a variable into an object.
+            (Default value = None, which uses the value as is)
+        bin_op : dict or None, optional
+             (Default value = _BINARY_OPERATOR_MAP)
+        un_op : dict or None, optional
+             (Default value = _UNARY_OPERATOR_MAP)
+
+        Returns
+        -------
+        callable
+            function taking a dict that maps each variable to its value.
+        """
+        define_variable = define_variable or (lambda name, value: value)
+        is_constant, obj = _compile_node(
+            self,
+            define_op,
+            frozenset(variables),
+            define_variable,
+            bin_op or _BINARY_OPERATOR_MAP,
+            un_op or _UNARY_OPERATOR_MAP,
+        )
+        if is_constant:
+            return lambda values: obj
+        return obj
+
+
+def _compile_node(node, define_op, variables, define_variable, bin_op, un_op):
+    """Compile an EvalTreeNode, see EvalTreeNode.compile.
+
+    Returns
+    -------
+    (bool, object)
+        (True, value) if the node does not depend on any variable, or
+        (False, function of the values of the variables) otherwise.
+    """
+    if node.right:
+        # binary or implicit operator
+        op_text = node.operator[1] if node.operator else ""
+        if op_text not in bin_op:
+            raise DefinitionSyntaxError('missing binary operator "%s"' % op_text)
+        op = bin_op[op_text]
+        left_constant, left = _compile_node(
+            node.left, define_op, variables, define_variable, bin_op, un_op
+        )
+        right_constant, right = _compile_node(
+            node.right, define_op, variables, define_variable, bin_op, un_op
+        )
+        if left_constant and right_constant:
+            return True, op(left, right)
+        elif left_constant:
+            return False, lambda values: op(left, right(values))
+        elif right_constant:
+            return False, lambda values: op(left(values), right)
+        return False, lambda values: op(left(values), right(values))
+    elif node.operator:
+        # unary operator
+        op_text = node.operator[1]
+        if op_text not in un_op:
+            raise DefinitionSyntaxError('missing unary operator "%s"' % op_text)
+        op = un_op[op_text]
+        constant, operand = _compile_node(
+            node.left, define_op, variables, define_variable, bin_op, un_op
+        )
+        if constant:
+            return True, op(operand)
+        return False, lambda values: op(operand(values))
+    elif node.left[0] == tokenlib.NAME and node.left[1] in variables:
+        # variable
+        name = node.left[1]
+        return False, lambda values: define_variable(name, values[name])
+    else:
+        # single value
+        return True, define_op(node.left)
+
 
 def build_eval_tree(tokens, op_priority=_OP_PRIORITY, index=0, depth=0, prev_op=None):
     """Build an evaluation tree from a set of tokens.
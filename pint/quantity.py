@@ -173,6 +173,13 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
     """
 
+    # _REGISTRY is only set on instances of this class; the classes built by
+    # build_quantity_class store it as a class attribute.
+    __slots__ = ("_REGISTRY", "_magnitude", "_units", "_dimensionality", "__weakref__")
+
+    #: Whether instances keep the bookkeeping of debug_used.
+    _debug = False
+
     #: Default formatting string.
     default_format = ""
 
@@ -217,8 +224,14 @@ class Quantity(PrettyIPython, SharedRegistryObject):
                 inst._magnitude = _to_magnitude(
                     value, inst.force_ndarray, inst.force_ndarray_like
                 )
-                inst._units = inst.UnitsContainer()
-        elif isinstance(units, (UnitsContainer, UnitDefinition)):
+                inst._units = inst.UnitsContainer().intern()
+        elif isinstance(units, UnitsContainer):
+            inst = SharedRegistryObject.__new__(cls)
+            inst._magnitude = _to_magnitude(
+                value, inst.force_ndarray, inst.force_ndarray_like
+            )
+            inst._units = units.intern()
+        elif isinstance(units, UnitDefinition):
             inst = SharedRegistryObject.__new__(cls)
             inst._magnitude = _to_magnitude(
                 value, inst.force_ndarray, inst.force_ndarray_like
@@ -248,14 +261,51 @@ class Quantity(PrettyIPython, SharedRegistryObject):
                 "UnitsContainer; not {}.".format(type(units))
             )
 
-        inst.__used = False
-        inst.__handling = None
+        if inst._debug:
+            inst.__used = False
+            inst.__handling = None
+
+        return inst
+
+    @classmethod
+    def _from_trusted(cls, magnitude, units):
+        """Build a Quantity from a magnitude and units that are known to be valid,
+        skipping the checks and dispatch performed by ``__new__``.
+
+        Only use it for internal results, e.g. a magnitude computed from the
+        magnitudes of other quantities.
+
+        Parameters
+        ----------
+        magnitude :
+            Magnitude of the Quantity, which must not be an upcast type or a value
+            that ``_to_magnitude`` would reject or convert (other than to an ndarray).
+        units : UnitsContainer
+            Units of the Quantity, which are interned if they are not already.
+
+        Returns
+        -------
+        pint.Quantity
+        """
+        inst = SharedRegistryObject.__new__(cls)
+        registry = inst._REGISTRY
+        if registry.force_ndarray or registry.force_ndarray_like:
+            magnitude = _to_magnitude(
+                magnitude, registry.force_ndarray, registry.force_ndarray_like
+            )
+        inst._magnitude = magnitude
+        if not getattr(units, "_interned", True):
+            units = units.intern()
+        inst._units = units
+        if cls._debug:
+            inst.__used = False
+            inst.__handling = None
 
         return inst
 
     @property
     def debug_used(self):
-        return self.__used
+        return self.__used if self._debug else False
 
     def __iter__(self):
         # Make sure that, if self.magnitude is not iterable, we raise TypeError as soon
@@ -265,20 +315,22 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
         def it_outer():
             for element in it_magnitude:
-                yield self.__class__(element, self._units)
+                yield self._from_trusted(element, self._units)
 
         return it_outer()
 
     def __copy__(self):
-        ret = self.__class__(copy.copy(self._magnitude), self._units)
-        ret.__used = self.__used
+        ret = self._from_trusted(copy.copy(self._magnitude), self._units)
+        if self._debug:
+            ret.__used = self.__used
         return ret
 
     def __deepcopy__(self, memo):
-        ret = self.__class__(
+        ret = self._from_trusted(
             copy.deepcopy(self._magnitude, memo), copy.deepcopy(self._units, memo)
         )
-        ret.__used = self.__used
+        if self._debug:
+            ret.__used = self.__used
         return ret
 
     def __str__(self):
@@ -477,8 +529,6 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
         return not bool(tmp.dimensionality)
 
-    _dimensionality = None
-
     @property
     def dimensionality(self):
         """
@@ -487,7 +537,9 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         dict
             Dimensionality of the Quantity, e.g. ``{length: 1, time: -1}``
         """
-        if self._dimensionality is None:
+        try:
+            return self._dimensionality
+        except AttributeError:
             self._dimensionality = self._REGISTRY._get_dimensionality(self._units)
 
         return self._dimensionality
@@ -495,7 +547,9 @@ class Quantity(PrettyIPython, SharedRegistryObject):
     def check(self, dimension):
         """Return true if the quantity's dimension matches passed dimension.
         """
-        return self.dimensionality == self._REGISTRY.get_dimensionality(dimension)
+        return self._REGISTRY._get_dimensionality_vector(
+            self._units
+        ) == self._REGISTRY.get_dimensionality_vector(dimension)
 
     @classmethod
     def from_list(cls, quant_list, units=None):
@@ -546,11 +600,27 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             else:
                 raise ValueError("Cannot determine units from empty sequence!")
 
+        # Group the elements by units to convert the magnitudes of each group at once
+        groups = {}
+        for i, seq_i in enumerate(seq):
+            try:
+                group = groups[seq_i._units]
+            except KeyError:
+                group = groups[seq_i._units] = ([], [])
+            group[0].append(i)
+            group[1].append(seq_i)
+
         a = np.empty(len_seq)
 
-        for i, seq_i in enumerate(seq):
-            a[i] = seq_i.m_as(units)
+        for indices, items in groups.values():
+            magnitudes = np.array([seq_i._magnitude for seq_i in items])
             # raises DimensionalityError if incompatible units are used in the sequence
+            if magnitudes.dtype.hasobject:
+                # e.g. Decimal magnitudes, which can't be converted as an array
+                a[indices] = [seq_i.m_as(units) for seq_i in items]
+            else:
+                group = items[0]._from_trusted(magnitudes, items[0]._units)
+                a[indices] = group.m_as(units)
 
         return cls(a, units)
 
@@ -592,12 +662,13 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             except DimensionalityError:
                 return False
 
+        get_vector = self._REGISTRY._get_dimensionality_vector
         if isinstance(other, (self._REGISTRY.Quantity, self._REGISTRY.Unit)):
-            return self.dimensionality == other.dimensionality
+            return get_vector(self._units) == get_vector(other._units)
 
         if isinstance(other, str):
-            return (
-                self.dimensionality == self._REGISTRY.parse_units(other).dimensionality
+            return get_vector(self._units) == get_vector(
+                self._REGISTRY.parse_units(other)._units
             )
 
         return self.dimensionless
@@ -660,7 +731,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
         magnitude = self._convert_magnitude_not_inplace(other, *contexts, **ctx_kwargs)
 
-        return self.__class__(magnitude, other)
+        return self._from_trusted(magnitude, other)
 
     def ito_root_units(self):
         """Return Quantity rescaled to root units."""
@@ -679,7 +750,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
         magnitude = self._convert_magnitude_not_inplace(other)
 
-        return self.__class__(magnitude, other)
+        return self._from_trusted(magnitude, other)
 
     def ito_base_units(self):
         """Return Quantity rescaled to base units."""
@@ -698,7 +769,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
         magnitude = self._convert_magnitude_not_inplace(other)
 
-        return self.__class__(magnitude, other)
+        return self._from_trusted(magnitude, other)
 
     def ito_reduced_units(self):
         """Return Quantity scaled in place to reduced units, i.e. one unit per
@@ -983,7 +1054,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
                 )
             else:
                 raise DimensionalityError(self._units, "dimensionless")
-            return self.__class__(magnitude, units)
+            return self._from_trusted(magnitude, units)
 
         if not self.dimensionality == other.dimensionality:
             raise DimensionalityError(
@@ -1062,7 +1133,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         else:
             raise OffsetUnitCalculusError(self._units, other._units)
 
-        return self.__class__(magnitude, units)
+        return self._from_trusted(magnitude, units)
 
     def __iadd__(self, other):
         if isinstance(other, datetime.datetime):
@@ -1119,18 +1190,23 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         if units_op is None:
             units_op = magnitude_op
 
-        offset_units_self = self._get_non_multiplicative_units()
+        # Quantities with multiplicative units only skip the offset unit checks
+        offset_units_self = self._REGISTRY._get_units_metadata(
+            self._units
+        ).non_multiplicative
         no_offset_units_self = len(offset_units_self)
 
         if not self._check(other):
 
-            if not self._ok_for_muldiv(no_offset_units_self):
-                raise OffsetUnitCalculusError(self._units, getattr(other, "units", ""))
-            if len(offset_units_self) == 1:
-                if self._units[offset_units_self[0]] != 1 or magnitude_op not in [
-                    operator.mul,
-                    operator.imul,
-                ]:
+            if offset_units_self:
+                if not self._ok_for_muldiv(no_offset_units_self):
+                    raise OffsetUnitCalculusError(
+                        self._units, getattr(other, "units", "")
+                    )
+                if no_offset_units_self == 1 and (
+                    self._units[offset_units_self[0]] != 1
+                    or magnitude_op not in [operator.mul, operator.imul]
+                ):
                     raise OffsetUnitCalculusError(
                         self._units, getattr(other, "units", "")
                     )
@@ -1149,17 +1225,21 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         if isinstance(other, self._REGISTRY.Unit):
             other = 1 * other
 
-        if not self._ok_for_muldiv(no_offset_units_self):
-            raise OffsetUnitCalculusError(self._units, other._units)
-        elif no_offset_units_self == 1 and len(self._units) == 1:
-            self.ito_root_units()
+        if offset_units_self:
+            if not self._ok_for_muldiv(no_offset_units_self):
+                raise OffsetUnitCalculusError(self._units, other._units)
+            elif no_offset_units_self == 1 and len(self._units) == 1:
+                self.ito_root_units()
 
-        no_offset_units_other = len(other._get_non_multiplicative_units())
+        no_offset_units_other = len(
+            other._REGISTRY._get_units_metadata(other._units).non_multiplicative
+        )
 
-        if not other._ok_for_muldiv(no_offset_units_other):
-            raise OffsetUnitCalculusError(self._units, other._units)
-        elif no_offset_units_other == 1 and len(other._units) == 1:
-            other.ito_root_units()
+        if no_offset_units_other:
+            if not other._ok_for_muldiv(no_offset_units_other):
+                raise OffsetUnitCalculusError(self._units, other._units)
+            elif no_offset_units_other == 1 and len(other._units) == 1:
+                other.ito_root_units()
 
         self._magnitude = magnitude_op(self._magnitude, other._magnitude)
         self._units = units_op(self._units, other._units)
@@ -1189,18 +1269,23 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         if units_op is None:
             units_op = magnitude_op
 
-        offset_units_self = self._get_non_multiplicative_units()
+        # Quantities with multiplicative units only skip the offset unit checks
+        offset_units_self = self._REGISTRY._get_units_metadata(
+            self._units
+        ).non_multiplicative
         no_offset_units_self = len(offset_units_self)
 
         if not self._check(other):
 
-            if not self._ok_for_muldiv(no_offset_units_self):
-                raise OffsetUnitCalculusError(self._units, getattr(other, "units", ""))
-            if len(offset_units_self) == 1:
-                if self._units[offset_units_self[0]] != 1 or magnitude_op not in [
-                    operator.mul,
-                    operator.imul,
-                ]:
+            if offset_units_self:
+                if not self._ok_for_muldiv(no_offset_units_self):
+                    raise OffsetUnitCalculusError(
+                        self._units, getattr(other, "units", "")
+                    )
+                if no_offset_units_self == 1 and (
+                    self._units[offset_units_self[0]] != 1
+                    or magnitude_op not in [operator.mul, operator.imul]
+                ):
                     raise OffsetUnitCalculusError(
                         self._units, getattr(other, "units", "")
                     )
@@ -1216,29 +1301,33 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             magnitude = magnitude_op(self._magnitude, other_magnitude)
             units = units_op(self._units, self.UnitsContainer())
 
-            return self.__class__(magnitude, units)
+            return self._from_trusted(magnitude, units)
 
         if isinstance(other, self._REGISTRY.Unit):
             other = 1 * other
 
         new_self = self
 
-        if not self._ok_for_muldiv(no_offset_units_self):
-            raise OffsetUnitCalculusError(self._units, other._units)
-        elif no_offset_units_self == 1 and len(self._units) == 1:
-            new_self = self.to_root_units()
+        if offset_units_self:
+            if not self._ok_for_muldiv(no_offset_units_self):
+                raise OffsetUnitCalculusError(self._units, other._units)
+            elif no_offset_units_self == 1 and len(self._units) == 1:
+                new_self = self.to_root_units()
 
-        no_offset_units_other = len(other._get_non_multiplicative_units())
+        no_offset_units_other = len(
+            other._REGISTRY._get_units_metadata(other._units).non_multiplicative
+        )
 
-        if not other._ok_for_muldiv(no_offset_units_other):
-            raise OffsetUnitCalculusError(self._units, other._units)
-        elif no_offset_units_other == 1 and len(other._units) == 1:
-            other = other.to_root_units()
+        if no_offset_units_other:
+            if not other._ok_for_muldiv(no_offset_units_other):
+                raise OffsetUnitCalculusError(self._units, other._units)
+            elif no_offset_units_other == 1 and len(other._units) == 1:
+                other = other.to_root_units()
 
         magnitude = magnitude_op(new_self._magnitude, other._magnitude)
         units = units_op(new_self._units, other._units)
 
-        return self.__class__(magnitude, units)
+        return self._from_trusted(magnitude, units)
 
     def __imul__(self, other):
         if is_duck_array_type(type(self._magnitude)):
@@ -1279,13 +1368,16 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         except TypeError:
             return NotImplemented
 
-        no_offset_units_self = len(self._get_non_multiplicative_units())
-        if not self._ok_for_muldiv(no_offset_units_self):
-            raise OffsetUnitCalculusError(self._units, "")
-        elif no_offset_units_self == 1 and len(self._units) == 1:
-            self = self.to_root_units()
+        no_offset_units_self = len(
+            self._REGISTRY._get_units_metadata(self._units).non_multiplicative
+        )
+        if no_offset_units_self:
+            if not self._ok_for_muldiv(no_offset_units_self):
+                raise OffsetUnitCalculusError(self._units, "")
+            elif no_offset_units_self == 1 and len(self._units) == 1:
+                self = self.to_root_units()
 
-        return self.__class__(other_magnitude / self._magnitude, 1 / self._units)
+        return self._from_trusted(other_magnitude / self._magnitude, 1 / self._units)
 
     __div__ = __truediv__
     __rdiv__ = __rtruediv__
@@ -1309,7 +1401,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             magnitude = self.to("")._magnitude // other
         else:
             raise DimensionalityError(self._units, "dimensionless")
-        return self.__class__(magnitude, self.UnitsContainer({}))
+        return self._from_trusted(magnitude, self.UnitsContainer({}))
 
     @check_implemented
     def __rfloordiv__(self, other):
@@ -1319,7 +1411,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             magnitude = other // self.to("")._magnitude
         else:
             raise DimensionalityError(self._units, "dimensionless")
-        return self.__class__(magnitude, self.UnitsContainer({}))
+        return self._from_trusted(magnitude, self.UnitsContainer({}))
 
     @check_implemented
     def __imod__(self, other):
@@ -1333,16 +1425,16 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         if not self._check(other):
             other = self.__class__(other, self.UnitsContainer({}))
         magnitude = self._magnitude % other.to(self._units)._magnitude
-        return self.__class__(magnitude, self._units)
+        return self._from_trusted(magnitude, self._units)
 
     @check_implemented
     def __rmod__(self, other):
         if self._check(other):
             magnitude = other._magnitude % self.to(other._units)._magnitude
-            return self.__class__(magnitude, other._units)
+            return self._from_trusted(magnitude, other._units)
         elif self.dimensionless:
             magnitude = other % self.to("")._magnitude
-            return self.__class__(magnitude, self.UnitsContainer({}))
+            return self._from_trusted(magnitude, self.UnitsContainer({}))
         else:
             raise DimensionalityError(self._units, "dimensionless")
 
@@ -1352,8 +1444,8 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             other = self.__class__(other, self.UnitsContainer({}))
         q, r = divmod(self._magnitude, other.to(self._units)._magnitude)
         return (
-            self.__class__(q, self.UnitsContainer({})),
-            self.__class__(r, self._units),
+            self._from_trusted(q, self.UnitsContainer({})),
+            self._from_trusted(r, self._units),
         )
 
     @check_implemented
@@ -1366,7 +1458,10 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             unit = self.UnitsContainer({})
         else:
             raise DimensionalityError(self._units, "dimensionless")
-        return (self.__class__(q, self.UnitsContainer({})), self.__class__(r, unit))
+        return (
+            self._from_trusted(q, self.UnitsContainer({})),
+            self._from_trusted(r, unit),
+        )
 
     @check_implemented
     def __ipow__(self, other):
@@ -1484,7 +1579,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
                     units = new_self._units ** exponent
 
             magnitude = new_self._magnitude ** exponent
-            return self.__class__(magnitude, units)
+            return self._from_trusted(magnitude, units)
 
     @check_implemented
     def __rpow__(self, other):
@@ -1501,16 +1596,16 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             return other ** new_self._magnitude
 
     def __abs__(self):
-        return self.__class__(abs(self._magnitude), self._units)
+        return self._from_trusted(abs(self._magnitude), self._units)
 
     def __round__(self, ndigits=0):
-        return self.__class__(round(self._magnitude, ndigits=ndigits), self._units)
+        return self._from_trusted(round(self._magnitude, ndigits=ndigits), self._units)
 
     def __pos__(self):
-        return self.__class__(operator.pos(self._magnitude), self._units)
+        return self._from_trusted(operator.pos(self._magnitude), self._units)
 
     def __neg__(self):
-        return self.__class__(operator.neg(self._magnitude), self._units)
+        return self._from_trusted(operator.neg(self._magnitude), self._units)
 
     @check_implemented
     def __eq__(self, other):
@@ -1715,7 +1810,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
             else:
                 raise DimensionalityError("dimensionless", self._units)
 
-        return self.__class__(self.magnitude.clip(**kwargs), self._units)
+        return self._from_trusted(self.magnitude.clip(**kwargs), self._units)
 
     def fill(self, value):
         self._units = value._units
@@ -1732,20 +1827,20 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
     @property
     def real(self):
-        return self.__class__(self._magnitude.real, self._units)
+        return self._from_trusted(self._magnitude.real, self._units)
 
     @property
     def imag(self):
-        return self.__class__(self._magnitude.imag, self._units)
+        return self._from_trusted(self._magnitude.imag, self._units)
 
     @property
     def T(self):
-        return self.__class__(self._magnitude.T, self._units)
+        return self._from_trusted(self._magnitude.T, self._units)
 
     @property
     def flat(self):
         for v in self._magnitude.flat:
-            yield self.__class__(v, self._units)
+            yield self._from_trusted(v, self._units)
 
     @property
     def shape(self):
@@ -1831,7 +1926,7 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 
     def __getitem__(self, key):
         try:
-            return type(self)(self._magnitude[key], self._units)
+            return self._from_trusted(self._magnitude[key], self._units)
         except PintTypeError:
             raise
         except TypeError:
@@ -1882,10 +1977,26 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         return [
             self.__class__(value, units).tolist()
             if isinstance(value, list)
-            else self.__class__(value, units)
+            else self._from_trusted(value, units)
             for value in self._magnitude.tolist()
         ]
 
+    def save(self, file):
+        """Save the quantity to an uncompressed ``.npz`` archive, holding the
+        magnitude and the units as metadata.
+
+        Load it with ``UnitRegistry.load``, optionally memory-mapping the magnitude.
+
+        Parameters
+        ----------
+        file : str, os.PathLike or file
+            Destination. As with ``numpy.savez``, the ``.npz`` extension is appended
+            to file names that lack it.
+        """
+        from .storage import save_quantities
+
+        save_quantities(file, self)
+
     # Measurement support
     def plus_minus(self, error, relative=False):
         if isinstance(error, self.__class__):
@@ -1899,33 +2010,21 @@ class Quantity(PrettyIPython, SharedRegistryObject):
         return self._REGISTRY.Measurement(copy.copy(self.magnitude), error, self._units)
 
     def _get_unit_definition(self, unit: str) -> UnitDefinition:
-        try:
-            return self._REGISTRY._units[unit]
-        except KeyError:
-            # pint#1062: The __init__ method of this object added the unit to
-            # UnitRegistry._units (e.g. units with prefix are added on the fly the
-            # first time they're used) but the key was later removed, e.g. because
-            # a Context with unit redefinitions was deactivated.
-            self._REGISTRY.parse_units(unit)
-            return self._REGISTRY._units[unit]
+        return self._REGISTRY._get_unit_definition(unit)
 
     # methods/properties that help for math operations with offset units
     @property
     def _is_multiplicative(self) -> bool:
         """Check if the Quantity object has only multiplicative units."""
-        return not self._get_non_multiplicative_units()
+        return not self._REGISTRY._get_units_metadata(self._units).non_multiplicative
 
     def _get_non_multiplicative_units(self) -> List[str]:
         """Return a list of the of non-multiplicative units of the Quantity object."""
-        return [
-            unit
-            for unit in self._units
-            if not self._get_unit_definition(unit).is_multiplicative
-        ]
+        return list(self._REGISTRY._get_units_metadata(self._units).non_multiplicative)
 
     def _get_delta_units(self) -> List[str]:
         """Return list of delta units ot the Quantity object."""
-        return [u for u in self._units if u.startswith("delta_")]
+        return list(self._REGISTRY._get_units_metadata(self._units).delta)
 
     def _has_compatible_delta(self, unit: str) -> bool:
         """"Check if Quantity object has a delta_unit that is compatible with unit
@@ -2052,8 +2151,51 @@ class Quantity(PrettyIPython, SharedRegistryObject):
 _Quantity = Quantity
 
 
+class QuantityBatch(list):
+    """A list of quantities with a compact pickled form.
+
+    The units of all the elements are pickled once in a table, and each element
+    as its magnitude and the index of its units in the table. Upon unpickling,
+    each unit of the table is checked against the application registry only once
+    and the quantities are rebuilt without the checks of ``Quantity.__new__``.
+
+    Elements must be quantities; measurements and other objects are rejected
+    when pickling.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        from . import _unpickle_batch
+
+        table = {}
+        codes = []
+        magnitudes = []
+        for q in self:
+            if type(q).__reduce__ is not _Quantity.__reduce__:
+                raise TypeError(
+                    "QuantityBatch can only pickle quantities, not {}".format(
+                        type(q).__name__
+                    )
+                )
+            codes.append(table.setdefault(q._units, len(table)))
+            magnitudes.append(q._magnitude)
+
+        return _unpickle_batch, (QuantityBatch, list(table), codes, magnitudes)
+
+
 def build_quantity_class(registry):
-    class Quantity(_Quantity):
-        _REGISTRY = registry
+    if registry._lean:
+
+        class Quantity(_Quantity):
+            __slots__ = ()
+            _REGISTRY = registry
+
+    else:
+
+        class Quantity(_Quantity):
+            __slots__ = ("__used", "__handling")
+            _REGISTRY = registry
+            _debug = True
 
     return Quantity
@@ -35,14 +35,14 @@ The module actually defines 5 registries with different capabilites:
 
 import copy
 import functools
-import itertools
+import hashlib
 import locale
 import os
+import pickle
 import re
-from collections import ChainMap, defaultdict
+import tempfile
+from collections import ChainMap, defaultdict, namedtuple
 from contextlib import contextmanager
-from decimal import Decimal
-from fractions import Fraction
 from io import StringIO
 from tokenize import NAME, NUMBER
 
@@ -53,9 +53,16 @@ except ImportError:
     import importlib_resources
 
 from . import registry_helpers, systems
-from .compat import babel_parse, tokenizer
+from .compat import HAS_NUMPY, babel_parse, np
 from .context import Context, ContextChain
-from .converters import LogarithmicConverter, ScaleConverter
+from .converters import (
+    CompiledConverter,
+    LogarithmicConverter,
+    ScaleConverter,
+    _is_inplace_safe,
+    convert_stream,
+    convert_with_plan,
+)
 from .definitions import (
     AliasDefinition,
     Definition,
@@ -71,6 +78,8 @@ from .errors import (
 )
 from .pint_eval import build_eval_tree
 from .util import (
+    AffixTrie,
+    LRUCache,
     ParserHelper,
     SourceIterator,
     UnitsContainer,
@@ -81,12 +90,42 @@ from .util import (
     logger,
     pi_theorem,
     solve_dependencies,
-    string_preprocessor,
     to_units_container,
+    tokenize_expression,
 )
 
 _BLOCK_RE = re.compile(r" |\(")
 
+#: A number followed by the text of its units, as split by parse_many.
+_VALUE_UNITS_RE = re.compile(
+    r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(.*?)\s*"
+)
+
+#: Version of the registry snapshot layout; bump it whenever the pickled state
+#: changes in an incompatible way.
+_SNAPSHOT_VERSION = 6
+
+#: Names of the caches that can be bounded with the cache_sizes registry option.
+_CACHE_NAMES = (
+    "parse_unit",
+    "root_units",
+    "dimensionality",
+    "dimensionality_vectors",
+    "units_metadata",
+    "base_units",
+    "conversion_plans",
+    "parse_expression",
+    "numpy_dispatch",
+)
+
+#: Default maximum number of results kept by the parse_expression cache.
+_PARSE_EXPRESSION_CACHE_SIZE = 1024
+
+
+def _new_cache(maxsize):
+    """Return an unbounded dict if maxsize is None, or a LRUCache otherwise."""
+    return {} if maxsize is None else LRUCache(maxsize)
+
 
 @functools.lru_cache()
 def pattern_to_regex(pattern):
@@ -101,6 +140,16 @@ def pattern_to_regex(pattern):
     return re.compile(pattern)
 
 
+@functools.lru_cache(maxsize=_PARSE_EXPRESSION_CACHE_SIZE)
+def _build_expression_tree(input_string):
+    """Tokenize a preprocessed expression and build its evaluation tree.
+
+    The tree only depends on the syntax of the expression, so it is shared
+    by all registries.
+    """
+    return build_eval_tree(tokenize_expression(input_string))
+
+
 class RegistryMeta(type):
     """This is just to call after_init at the right time
     instead of asking the developer to do it when subclassing.
@@ -122,8 +171,43 @@ class RegistryCache:
         self.root_units = {}
         #: Maps dimensionality (UnitsContainer) to Units (UnitsContainer)
         self.dimensionality = {}
+        #: Maps Units (UnitsContainer) to the exponents of the base dimensions (tuple),
+        #: see BaseRegistry.get_dimensionality_vector
+        self.dimensionality_vectors = {}
+        #: Maps Units (UnitsContainer) to their UnitsMetadata
+        self.units_metadata = {}
         #: Cache the unit name associated to user input. ('mV' -> 'millivolt')
         self.parse_unit = {}
+        #: Maps (src, dst) UnitsContainers to a conversion plan,
+        #: see BaseRegistry._build_conversion_plan
+        self.conversion_plans = {}
+        #: Maps (input string, parsing options) to the result of parse_expression
+        self.parse_expression = LRUCache(_PARSE_EXPRESSION_CACHE_SIZE)
+        #: Maps (function type, function name, unit signature) to the converters
+        #: and output unit of a NumPy function, see pint.numpy_func.implement_func
+        self.numpy_dispatch = {}
+
+    def limit(self, cache_sizes):
+        """Bound the size of caches, keeping their current entries forever.
+
+        Parameters
+        ----------
+        cache_sizes : dict
+            maps the name of a cache to its maximum number of additional entries.
+        """
+        for name in (
+            "root_units",
+            "dimensionality",
+            "dimensionality_vectors",
+            "units_metadata",
+            "parse_unit",
+            "conversion_plans",
+            "parse_expression",
+            "numpy_dispatch",
+        ):
+            maxsize = cache_sizes.get(name)
+            if maxsize is not None:
+                setattr(self, name, LRUCache(maxsize, getattr(self, name)))
 
 
 class ContextCacheOverlay:
@@ -131,11 +215,170 @@ class ContextCacheOverlay:
     active contexts which contain unit redefinitions.
     """
 
-    def __init__(self, registry_cache: RegistryCache):
+    def __init__(self, registry_cache: RegistryCache, cache_sizes=None):
+        cache_sizes = cache_sizes or {}
         self.dimensional_equivalents = registry_cache.dimensional_equivalents
-        self.root_units = {}
+        self.root_units = _new_cache(cache_sizes.get("root_units"))
         self.dimensionality = registry_cache.dimensionality
+        self.dimensionality_vectors = registry_cache.dimensionality_vectors
+        self.units_metadata = _new_cache(cache_sizes.get("units_metadata"))
         self.parse_unit = registry_cache.parse_unit
+        self.conversion_plans = _new_cache(cache_sizes.get("conversion_plans"))
+        self.parse_expression = LRUCache(
+            cache_sizes.get("parse_expression", _PARSE_EXPRESSION_CACHE_SIZE)
+        )
+        self.numpy_dispatch = _new_cache(cache_sizes.get("numpy_dispatch"))
+
+
+class UnitsMetadata(namedtuple("UnitsMetadata", "non_multiplicative delta")):
+    """Properties of the units of a UnitsContainer that decide how quantities
+    with these units are added and multiplied.
+
+    Parameters
+    ----------
+    non_multiplicative : tuple of str
+        names of the units that are not multiplicative, e.g. offset units.
+    delta : tuple of str
+        names of the delta units.
+    """
+
+
+class CompiledExpression:
+    """Expression parsed once by UnitRegistry.compile_expression, which can be
+    evaluated many times for different values of its variables.
+
+    Parameters
+    ----------
+    expression : str
+        the source of the expression.
+    variables : tuple of str
+        names of the variables, which must all be passed as keyword arguments
+        when calling the compiled expression.
+    func : callable
+        takes a dict mapping each variable to its value and returns the result.
+    """
+
+    def __init__(self, expression, variables, func):
+        self.expression = expression
+        self.variables = variables
+        self._variables = frozenset(variables)
+        self._func = func
+
+    def __call__(self, **values):
+        if values.keys() != self._variables:
+            missing = self._variables.difference(values)
+            if missing:
+                raise TypeError(
+                    "Missing values for variables: %s" % ", ".join(sorted(missing))
+                )
+            raise TypeError(
+                "Unknown variables: %s"
+                % ", ".join(sorted(set(values).difference(self._variables)))
+            )
+
+        # The result is cached when the expression has no variables and
+        # quantities are mutable, never hand out the same instance twice.
+        return copy.copy(self._func(values))
+
+    def __repr__(self):
+        return "<CompiledExpression(%r, %s)>" % (
+            self.expression,
+            ", ".join(repr(v) for v in self.variables),
+        )
+
+
+class CompiledPattern:
+    """Pattern compiled by UnitRegistry.compile_pattern, with the units of its
+    groups resolved once, which can extract quantities from many strings.
+
+    Parameters
+    ----------
+    pattern : str
+        the source of the pattern.
+    regex : re.Pattern
+        the pattern translated by pattern_to_regex.
+    units : dict
+        the Quantity of one unit of each group of the pattern, by group name.
+    """
+
+    def __init__(self, pattern, regex, units):
+        self.pattern = pattern
+        self.regex = regex
+        self._units = units
+
+    def __call__(self, input_string, many=False):
+        """Extract the quantities of the groups from a string, like
+        UnitRegistry.parse_pattern.
+
+        Parameters
+        ----------
+        input_string : str
+        many : bool
+            if True, return the quantities of all the matches instead of the
+            first one. (Default value = False)
+
+        Returns
+        -------
+        list of pint.Quantity, or list of lists if many is True.
+        None or an empty list if nothing matches.
+        """
+        results = []
+        if input_string:
+            for match in self.regex.finditer(input_string):
+                quantities = []
+                for name, value in match.groupdict().items():
+                    if value is None:
+                        # The group is not part of the match
+                        continue
+                    unit = self._units[name]
+                    quantities.append(
+                        unit._from_trusted(float(value) * unit._magnitude, unit._units)
+                    )
+                results.append(quantities)
+                if not many:
+                    break
+
+        if many:
+            return results
+        return results[0] if results else None
+
+    def parse_many(self, strings):
+        """Extract the quantities of the groups from the first match in each
+        string, gathered in an array per group.
+
+        Parameters
+        ----------
+        strings : iterable of str
+
+        Returns
+        -------
+        dict
+            Quantity with a magnitude per string for each group, by group name.
+            The magnitude is NaN when the string doesn't match the pattern or
+            the group is not part of the match.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("Pint requires NumPy to parse many strings at once.")
+
+        values = {name: [] for name in self._units}
+        search = self.regex.search
+        for string in strings:
+            match = search(string)
+            groups = match.groupdict("nan") if match else {}
+            for name, texts in values.items():
+                texts.append(groups.get(name, "nan"))
+
+        results = {}
+        for name, texts in values.items():
+            unit = self._units[name]
+            magnitudes = np.array(texts, dtype=float)
+            if unit._magnitude != 1:
+                magnitudes *= unit._magnitude
+            results[name] = unit._from_trusted(magnitudes, unit._units)
+        return results
+
+    def __repr__(self):
+        return "<CompiledPattern(%r)>" % self.pattern
 
 
 class BaseRegistry(metaclass=RegistryMeta):
@@ -173,6 +416,27 @@ class BaseRegistry(metaclass=RegistryMeta):
         numerical type used for non integer values. (Default: float)
     case_sensitive : bool, optional
         Control default case sensitivity of unit parsing. (Default: True)
+    cache_folder : str or None, optional
+        Folder where a snapshot of the parsed definitions is stored, to be reused
+        by registries created later with the same definition files and options.
+        The snapshot is a pickle file, so the folder must be trusted.
+        None disables snapshots. (Default: None)
+    lazy_cache : bool, optional
+        If True, the dimensionality and root units of each unit are computed when
+        first needed instead of when the registry is created, and the units grouped
+        by dimensionality when :meth:`get_compatible_units` is first called.
+        (Default: False)
+    cache_sizes : dict or None, optional
+        Maximum number of entries of the internal caches, by name: 'parse_unit',
+        'root_units', 'dimensionality', 'dimensionality_vectors', 'units_metadata',
+        'base_units', 'conversion_plans', 'parse_expression' and 'numpy_dispatch'.
+        When full, the least recently used entry is discarded, except for the entries
+        computed from the definition files when the registry is created. Caches not
+        listed are unbounded, except 'parse_expression' which keeps 1024 entries.
+        (Default: None)
+    lean : bool, optional
+        If True, quantities do not keep the debugging bookkeeping of
+        ``Quantity.debug_used``, making each instance smaller. (Default: False)
 
     """
 
@@ -194,11 +458,29 @@ class BaseRegistry(metaclass=RegistryMeta):
         fmt_locale=None,
         non_int_type=float,
         case_sensitive=True,
+        cache_folder=None,
+        lazy_cache=False,
+        cache_sizes=None,
+        lean=False,
     ):
+        self._lean = lean
+
         self._register_parsers()
         self._init_dynamic_classes()
 
         self._filename = filename
+        self._cache_folder = cache_folder
+        self._lazy_cache = lazy_cache
+
+        #: Maximum size of each internal cache. See _CACHE_NAMES.
+        self._cache_sizes = dict(cache_sizes or {})
+        for name in self._cache_sizes:
+            if name not in _CACHE_NAMES:
+                raise ValueError(
+                    "Unknown cache '{}', valid names are: {}".format(
+                        name, ", ".join(_CACHE_NAMES)
+                    )
+                )
         self.force_ndarray = force_ndarray
         self.force_ndarray_like = force_ndarray_like
         self.preprocessors = preprocessors or []
@@ -225,6 +507,10 @@ class BaseRegistry(metaclass=RegistryMeta):
         #: Map dimension name (string) to its definition (DimensionDefinition).
         self._dimensions = {}
 
+        #: Map base dimension name (string) to its index in dimensionality vectors,
+        #: or None if it must be recomputed.
+        self._base_dimension_indices = None
+
         #: Map unit name (string) to its definition (UnitDefinition).
         #: Might contain prefixed units.
         self._units = {}
@@ -241,9 +527,16 @@ class BaseRegistry(metaclass=RegistryMeta):
         #: Map suffix name (string) to canonical , and unit alias to canonical unit name
         self._suffixes = {"": "", "s": ""}
 
+        #: Tries of the keys of _prefixes and _suffixes, used to parse unit names.
+        self._prefix_trie = AffixTrie(self._prefixes)
+        self._suffix_trie = AffixTrie(self._suffixes, reverse=True)
+
         #: Map contexts to RegistryCache
         self._cache = RegistryCache()
 
+        #: True once the dimensional_equivalents of the cache have been filled.
+        self._dimensional_equivalents_built = False
+
         self._initialized = False
 
     def _init_dynamic_classes(self):
@@ -260,17 +553,160 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         self.Measurement = build_measurement_class(self)
 
+        from .mixed import build_mixed_unit_array_class
+
+        self.MixedUnitArray = build_mixed_unit_array_class(self)
+
+        from .shared import build_shared_quantity_class
+
+        self.SharedQuantity = build_shared_quantity_class(self)
+
     def _after_init(self):
         """This should be called after all __init__"""
 
-        if self._filename == "":
-            self.load_definitions("default_en.txt", True)
-        elif self._filename is not None:
-            self.load_definitions(self._filename)
+        snapshot_path = self._snapshot_path()
+        if snapshot_path is None or not self._load_snapshot(snapshot_path):
+            if self._filename == "":
+                self.load_definitions("default_en.txt", True)
+            elif self._filename is not None:
+                self.load_definitions(self._filename)
+
+            self._build_cache()
+
+            if snapshot_path is not None:
+                self._save_snapshot(snapshot_path)
 
-        self._build_cache()
         self._initialized = True
 
+    def _snapshot_path(self):
+        """Return the path of the snapshot matching the definition files and the
+        options of this registry, or None if snapshots cannot be used.
+        """
+        if self._cache_folder is None or not isinstance(self._filename, str):
+            return None
+
+        from . import __version__
+
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr((_SNAPSHOT_VERSION, __version__, self._snapshot_options())).encode(
+                "utf-8"
+            )
+        )
+        try:
+            if self._filename == "":
+                self._hash_definitions(hasher, "default_en.txt", True)
+            else:
+                self._hash_definitions(hasher, self._filename, False)
+        except OSError as exc:
+            logger.debug(f"Cannot hash definitions for snapshot: {exc!r}")
+            return None
+
+        return os.path.join(
+            os.path.expanduser(self._cache_folder), hasher.hexdigest() + ".pickle"
+        )
+
+    def _hash_definitions(self, hasher, file, is_resource):
+        """Feed the content of a definition file, and of the files it imports,
+        to hasher.
+        """
+        if is_resource:
+            rbytes = importlib_resources.read_binary(__package__, file)
+        else:
+            with open(file, "rb") as fp:
+                rbytes = fp.read()
+
+        hasher.update(rbytes)
+
+        for line in rbytes.decode("utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line.startswith("@import"):
+                path = line[7:].strip()
+                if not is_resource:
+                    path = os.path.join(os.path.dirname(file), os.path.normpath(path))
+                self._hash_definitions(hasher, path, is_resource)
+
+    def _snapshot_options(self):
+        """Options that change the content of the registry after loading the
+        definitions, used to key the snapshot.
+        """
+        return {
+            "registry": type(self).__module__ + "." + type(self).__qualname__,
+            "non_int_type": self.non_int_type.__module__
+            + "."
+            + self.non_int_type.__qualname__,
+            "case_sensitive": self.case_sensitive,
+            "lazy_cache": self._lazy_cache,
+            "cache_sizes": sorted(self._cache_sizes.items()),
+        }
+
+    def _snapshot_state(self):
+        """Return the state that is stored in a snapshot.
+        Subclasses extend the returned dict.
+        """
+        return {
+            "_defaults": self._defaults,
+            "_dimensions": self._dimensions,
+            "_units": self._units,
+            "_units_casei": self._units_casei,
+            "_prefixes": self._prefixes,
+            "_suffixes": self._suffixes,
+            "_cache": self._cache,
+            "_dimensional_equivalents_built": self._dimensional_equivalents_built,
+        }
+
+    def _restore_snapshot_state(self, state):
+        """Restore the state returned by :meth:`_snapshot_state`."""
+        self._defaults = state["_defaults"]
+        self._dimensions = state["_dimensions"]
+        self._base_dimension_indices = None
+        self._units = state["_units"]
+        self._units_casei = state["_units_casei"]
+        self._prefixes = state["_prefixes"]
+        self._suffixes = state["_suffixes"]
+        self._prefix_trie = AffixTrie(self._prefixes)
+        self._suffix_trie = AffixTrie(self._suffixes, reverse=True)
+        self._cache = state["_cache"]
+        self._dimensional_equivalents_built = state["_dimensional_equivalents_built"]
+
+    def _load_snapshot(self, path):
+        """Load the registry state from a snapshot.
+
+        Returns
+        -------
+        bool
+            False if the snapshot does not exist or cannot be read.
+        """
+        try:
+            with open(path, "rb") as fp:
+                state = pickle.load(fp)
+        except FileNotFoundError:
+            return False
+        except Exception as exc:
+            logger.debug(f"Cannot load registry snapshot {path}: {exc!r}")
+            return False
+
+        self._restore_snapshot_state(state)
+        return True
+
+    def _save_snapshot(self, path):
+        """Store the registry state in a snapshot.
+        The file is written atomically, so concurrent processes never read a
+        partially written snapshot.
+        """
+        folder = os.path.dirname(path)
+        tmp_path = None
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=folder)
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(self._snapshot_state(), fp, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            logger.debug(f"Cannot save registry snapshot {path}: {exc!r}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _register_parsers(self):
         self._register_parser("@defaults", self._parse_defaults)
 
@@ -367,6 +803,15 @@ class BaseRegistry(metaclass=RegistryMeta):
         else:
             self._define(definition)
 
+        # Conversion factors and parsed expressions may change with the new definition
+        self._clear_definition_caches()
+
+    def _clear_definition_caches(self):
+        self._cache.conversion_plans.clear()
+        self._cache.units_metadata.clear()
+        self._cache.parse_expression.clear()
+        self._cache.numpy_dispatch.clear()
+
     def _define(self, definition):
         """Add unit to the registry.
 
@@ -388,6 +833,11 @@ class BaseRegistry(metaclass=RegistryMeta):
         if isinstance(definition, DimensionDefinition):
             d, di = self._dimensions, None
 
+            if definition.is_base:
+                # Dimensionality vectors get a new component
+                self._base_dimension_indices = None
+                self._cache.dimensionality_vectors.clear()
+
         elif isinstance(definition, UnitDefinition):
             d, di = self._units, self._units_casei
 
@@ -451,6 +901,13 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         self._define_adder(d_def, d, di)
 
+        if d is self._prefixes:
+            self._prefix_trie.add(definition.name)
+            if definition.has_symbol:
+                self._prefix_trie.add(definition.symbol)
+            for alias in definition.aliases:
+                self._prefix_trie.add(alias)
+
         return definition, d, di
 
     def _define_adder(self, definition, unit_dict, casei_unit_dict):
@@ -595,6 +1052,13 @@ class BaseRegistry(metaclass=RegistryMeta):
         """Build a cache of dimensionality and base units."""
         self._cache = RegistryCache()
 
+        if self._lazy_cache:
+            # Entries are added by _get_root_units and _get_dimensionality on
+            # first use, and by _build_dimensional_equivalents when needed.
+            self._cache.limit(self._cache_sizes)
+            self._dimensional_equivalents_built = False
+            return
+
         deps = {
             name: definition.reference.keys() if definition.reference else set()
             for name, definition in self._units.items()
@@ -628,6 +1092,39 @@ class BaseRegistry(metaclass=RegistryMeta):
                 except Exception as exc:
                     logger.warning(f"Could not resolve {unit_name}: {exc!r}")
 
+        # Entries derived from the definitions are never discarded.
+        self._cache.limit(self._cache_sizes)
+        self._dimensional_equivalents_built = True
+
+    def _build_dimensional_equivalents(self):
+        """Group the units without prefix by dimensionality.
+        Only used with a lazy cache, as _build_cache does it otherwise.
+        """
+        dimensional_equivalents = self._cache.dimensional_equivalents
+
+        for unit_name in list(self._units):
+            if "[" in unit_name:
+                continue
+            parsed_names = self.parse_unit_name(unit_name)
+            if parsed_names:
+                prefix, base_name, _ = parsed_names[0]
+            else:
+                prefix, base_name = "", unit_name
+            if prefix:
+                continue
+
+            try:
+                di = self._get_dimensionality(
+                    ParserHelper.from_word(base_name, self.non_int_type)
+                )
+                dimensional_equivalents.setdefault(di, set()).add(
+                    self._units[base_name]._name
+                )
+            except Exception as exc:
+                logger.warning(f"Could not resolve {unit_name}: {exc!r}")
+
+        self._dimensional_equivalents_built = True
+
     def get_name(self, name_or_alias, case_sensitive=None):
         """Return the canonical name of a unit.
         """
@@ -723,6 +1220,100 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         return dims
 
+    @property
+    def base_dimensions(self):
+        """Names of the base dimensions, in the order of the exponents returned
+        by :meth:`get_dimensionality_vector`.
+        """
+        return tuple(self._get_base_dimension_indices())
+
+    def _get_base_dimension_indices(self):
+        if self._base_dimension_indices is None:
+            self._base_dimension_indices = {
+                name: index
+                for index, name in enumerate(
+                    name
+                    for name, definition in self._dimensions.items()
+                    if definition.is_base and name != "[]"
+                )
+            }
+        return self._base_dimension_indices
+
+    def get_dimensionality_vector(self, input_units):
+        """Convert unit or dict of units or dimensions to the exponents of the base
+        dimensions.
+
+        Dimensionality vectors of the same registry have the same length, so
+        comparing them is faster than comparing dimensionalities, and they can be
+        stacked in arrays to check many units at once.
+
+        Parameters
+        ----------
+        input_units : str, dict, UnitsContainer, Unit or Quantity
+
+        Returns
+        -------
+        tuple
+            the exponent of each base dimension, in the order of
+            :attr:`base_dimensions`.
+
+        Examples
+        --------
+        >>> ureg.get_dimensionality_vector("m/s")[:2]
+        (1, -1)
+        """
+        input_units = to_units_container(input_units)
+
+        return self._get_dimensionality_vector(input_units)
+
+    def _get_dimensionality_vector(self, input_units):
+        """Convert a UnitsContainer to the exponents of the base dimensions."""
+        cache = self._cache.dimensionality_vectors
+
+        try:
+            return cache[input_units]
+        except KeyError:
+            pass
+
+        indices = self._get_base_dimension_indices()
+        vector = [0] * len(indices)
+        for name, exponent in self._get_dimensionality(input_units).items():
+            vector[indices[name]] = exponent
+
+        vector = cache[input_units] = tuple(vector)
+        return vector
+
+    def _get_unit_definition(self, name):
+        """Return the definition of a unit name, which may be prefixed."""
+        try:
+            return self._units[name]
+        except KeyError:
+            # pint#1062: the unit was added to _units when first parsed (e.g. units
+            # with prefix are added on the fly the first time they're used) but the
+            # key was later removed, e.g. because a Context with unit redefinitions
+            # was deactivated.
+            self.parse_units(name)
+            return self._units[name]
+
+    def _get_units_metadata(self, units):
+        """Return the UnitsMetadata of a UnitsContainer."""
+        cache = self._cache.units_metadata
+
+        try:
+            return cache[units]
+        except KeyError:
+            pass
+
+        metadata = cache[units] = UnitsMetadata(
+            tuple(
+                name
+                for name in units
+                if not self._get_unit_definition(name).is_multiplicative
+            ),
+            tuple(name for name in units if name.startswith("delta_")),
+        )
+        return metadata
+
     def _get_dimensionality_recurse(self, ref, exp, accumulator):
         for key in ref:
             exp2 = exp * ref[key]
@@ -893,6 +1484,9 @@ class BaseRegistry(metaclass=RegistryMeta):
         if not input_units:
             return frozenset()
 
+        if not self._dimensional_equivalents_built:
+            self._build_dimensional_equivalents()
+
         src_dim = self._get_dimensionality(input_units)
         return self._cache.dimensional_equivalents[src_dim]
 
@@ -952,6 +1546,92 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         return self._convert(value, src, dst, inplace)
 
+    def get_converter(self, src, dst):
+        """Return a callable converting magnitudes from some source to destination
+        units.
+
+        The conversion is resolved once, so that calling the returned object
+        only performs the arithmetic. Unit redefinitions of the contexts active
+        when calling this method are taken into account, but transformations
+        between different dimensionalities defined by contexts are not.
+
+        Parameters
+        ----------
+        src : pint.Quantity or str
+            source units.
+        dst : pint.Quantity or str
+            destination units.
+
+        Returns
+        -------
+        pint.converters.CompiledConverter
+            callable taking a magnitude and optional `inplace` and `out`
+            arguments, and returning the converted magnitude.
+
+        """
+        src = to_units_container(src, self)
+        dst = to_units_container(dst, self)
+
+        return CompiledConverter(src, dst, self._build_conversion_plan(src, dst))
+
+    def convert_stream(self, iterable, src, dst, chunk_size=None, inplace=False):
+        """Convert magnitudes pulled from an iterable, e.g. read from a large file,
+        yielding converted chunks with bounded memory.
+
+        The conversion is resolved once, with the contexts active when calling this
+        method, and raises DimensionalityError right away if it is not possible.
+
+        Parameters
+        ----------
+        iterable :
+            numbers or arrays, in source units.
+        src : pint.Quantity or str
+            source units.
+        dst : pint.Quantity or str
+            destination units.
+        chunk_size : int, optional
+            if given, consecutive numbers are gathered in arrays of this size,
+            which are converted and yielded together. Requires NumPy.
+            (Default value = None, converting each number on its own)
+        inplace : bool
+            if True, float arrays pulled from the iterable are converted in place.
+            Arrays gathered from numbers always are. (Default value = False)
+
+        Returns
+        -------
+        generator
+            yielding the converted numbers or arrays.
+        """
+        if chunk_size is not None:
+            if not HAS_NUMPY:
+                raise RuntimeError("Pint requires NumPy to convert numbers in chunks.")
+            if chunk_size < 1:
+                raise ValueError(
+                    "chunk_size must be positive, not {}".format(chunk_size)
+                )
+
+        src = to_units_container(src, self)
+        dst = to_units_container(dst, self)
+        converter = self._get_stream_converter(src, dst)
+        return convert_stream(iterable, converter, chunk_size, inplace)
+
+    def _get_stream_converter(self, src, dst):
+        """Return the callable used by convert_stream to convert magnitudes.
+
+        Parameters
+        ----------
+        src : UnitsContainer
+            source units.
+        dst : UnitsContainer
+            destination units.
+
+        Returns
+        -------
+        callable
+            taking a magnitude and an `inplace` argument.
+        """
+        return CompiledConverter(src, dst, self._build_conversion_plan(src, dst))
+
     def _convert(self, value, src, dst, inplace=False, check_dimensionality=True):
         """Convert value from some source to destination units.
 
@@ -975,33 +1655,50 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         """
 
-        if check_dimensionality:
+        if not check_dimensionality:
+            return convert_with_plan(
+                value, (None, self._get_root_units(src / dst)[0], None), inplace
+            )
 
-            src_dim = self._get_dimensionality(src)
-            dst_dim = self._get_dimensionality(dst)
+        plans = self._cache.conversion_plans
+        try:
+            plan = plans[src, dst]
+        except KeyError:
+            pass
+        else:
+            return convert_with_plan(value, plan, inplace)
 
-            # If the source and destination dimensionality are different,
-            # then the conversion cannot be performed.
-            if src_dim != dst_dim:
-                raise DimensionalityError(src, dst, src_dim, dst_dim)
+        plan = plans[src, dst] = self._build_conversion_plan(src, dst)
+        return convert_with_plan(value, plan, inplace)
 
-        # Here src and dst have only multiplicative units left. Thus we can
-        # convert with a factor.
-        factor, _ = self._get_root_units(src / dst)
+    def _build_conversion_plan(self, src, dst):
+        """Resolve the conversion between two units, raising DimensionalityError
+        if it is not possible.
 
-        # factor is type float and if our magnitude is type Decimal then
-        # must first convert to Decimal before we can '*' the values
-        if isinstance(value, Decimal):
-            factor = Decimal(str(factor))
-        elif isinstance(value, Fraction):
-            factor = Fraction(str(factor))
+        Parameters
+        ----------
+        src : UnitsContainer
+            source units.
+        dst : UnitsContainer
+            destination units.
 
-        if inplace:
-            value *= factor
-        else:
-            value = value * factor
+        Returns
+        -------
+        tuple
+            (src_converter, factor, dst_converter). The converters handle
+            the non multiplicative units and are None if there are none.
+        """
+        # If the source and destination dimensionality are different,
+        # then the conversion cannot be performed.
+        if self._get_dimensionality_vector(src) != self._get_dimensionality_vector(dst):
+            raise DimensionalityError(
+                src, dst, self._get_dimensionality(src), self._get_dimensionality(dst)
+            )
 
-        return value
+        # Here src and dst have only multiplicative units left. Thus we can
+        # convert with a factor.
+        factor, _ = self._get_root_units(src / dst)
+        return None, factor, None
 
     def parse_unit_name(self, unit_name, case_sensitive=None):
         """Parse a unit to identify prefix, unit name and suffix
@@ -1032,10 +1729,9 @@ class BaseRegistry(metaclass=RegistryMeta):
         case_sensitive = (
             self.case_sensitive if case_sensitive is None else case_sensitive
         )
-        stw = unit_name.startswith
-        edw = unit_name.endswith
-        for suffix, prefix in itertools.product(self._suffixes, self._prefixes):
-            if stw(prefix) and edw(suffix):
+        prefixes = self._prefix_trie.matches(unit_name)
+        for suffix in self._suffix_trie.matches(unit_name):
+            for prefix in prefixes:
                 name = unit_name[len(prefix) :]
                 if suffix:
                     name = name[: -len(suffix)]
@@ -1135,7 +1831,7 @@ class BaseRegistry(metaclass=RegistryMeta):
                     cname = "delta_" + cname
             ret[cname] = value
 
-        ret = self.UnitsContainer(ret)
+        ret = self.UnitsContainer(ret).intern()
 
         if as_delta:
             cache[input_string] = ret
@@ -1199,33 +1895,43 @@ class BaseRegistry(metaclass=RegistryMeta):
         if not input_string:
             return [] if many else None
 
-        # Parse string
-        pattern = pattern_to_regex(pattern)
-        matched = re.finditer(pattern, input_string)
+        return self.compile_pattern(pattern, case_sensitive, use_decimal)(
+            input_string, many
+        )
 
-        # Extract result(s)
-        results = []
-        for match in matched:
-            # Extract units from result
-            match = match.groupdict()
-
-            # Parse units
-            units = []
-            for unit, value in match.items():
-                # Construct measure by multiplying value by unit
-                units.append(
-                    float(value)
-                    * self.parse_expression(unit, case_sensitive, use_decimal)
-                )
+    def compile_pattern(self, pattern, case_sensitive=None, use_decimal=False):
+        """Compile a pattern for parse_pattern once, resolving the units of its
+        groups, to extract quantities from many strings.
 
-            # Add to results
-            results.append(units)
+        Parameters
+        ----------
+        pattern : str
+            The regex parse string, where each "{unit_name}" matches a number in
+            those units.
+        case_sensitive :
+             (Default value = None, which uses registry setting)
+        use_decimal :
+             (Default value = False)
 
-            # Return first match only
-            if not many:
-                return results[0]
+        Returns
+        -------
+        CompiledPattern
+            callable taking a string and returning the same result as
+            ``parse_pattern(input_string, pattern)``, and whose ``parse_many``
+            method returns an array Quantity per group for many strings.
 
-        return results
+        Examples
+        --------
+        >>> height = ureg.compile_pattern(r"{foot} ft {inch} in")
+        >>> height.parse_many(["5 ft 11 in", "6 ft 2 in"])["inch"]
+        <Quantity([11.  2.], 'inch')>
+        """
+        regex = pattern_to_regex(pattern)
+        units = {
+            name: self.parse_expression(name, case_sensitive, use_decimal)
+            for name in regex.groupindex
+        }
+        return CompiledPattern(pattern, regex, units)
 
     def parse_expression(
         self, input_string, case_sensitive=None, use_decimal=False, **values
@@ -1264,15 +1970,207 @@ class BaseRegistry(metaclass=RegistryMeta):
 
         for p in self.preprocessors:
             input_string = p(input_string)
-        input_string = string_preprocessor(input_string)
-        gen = tokenizer(input_string)
 
-        return build_eval_tree(gen).evaluate(
-            lambda x: self._eval_token(x, case_sensitive=case_sensitive, **values)
+        if values:
+            return _build_expression_tree(input_string).evaluate(
+                lambda x: self._eval_token(x, case_sensitive=case_sensitive, **values)
+            )
+
+        cache = self._cache.parse_expression
+        key = self._parse_expression_key(input_string, case_sensitive)
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        else:
+            # Quantities are mutable, never hand out the cached instance.
+            return copy.copy(result)
+
+        result = cache[key] = _build_expression_tree(input_string).evaluate(
+            lambda x: self._eval_token(x, case_sensitive=case_sensitive)
         )
+        return copy.copy(result)
 
     __call__ = parse_expression
 
+    def parse_many(self, strings, to=None):
+        """Parse many strings like "12.5 km" into a single Quantity array.
+
+        The number of each string is split from the text of its units, and each
+        distinct text is parsed once. Strings that are not a number followed by
+        units are parsed with parse_expression. Invalid strings do not abort the
+        batch: they are reported by index and their magnitude is NaN.
+
+        Parameters
+        ----------
+        strings : sequence of str
+        to : pint.Quantity, str or None
+            units of the result. (Default value = None, which uses the units of
+            the first valid string)
+
+        Returns
+        -------
+        pint.Quantity, dict
+            the quantity with a magnitude per string, and the exceptions raised
+            by the invalid strings by index.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("Pint requires NumPy to parse many strings at once.")
+
+        magnitudes = np.full(len(strings), np.nan)
+        errors = {}
+        # Indices of the strings of each units
+        groups = {}
+        # Units of each distinct text, or None if it can't be parsed as units
+        parsed = {}
+        for i, string in enumerate(strings):
+            try:
+                match = _VALUE_UNITS_RE.fullmatch(string)
+                units = None
+                if match:
+                    text = match.group(2)
+                    try:
+                        units = parsed[text]
+                    except KeyError:
+                        try:
+                            units = self._parse_units(text)
+                        except Exception:
+                            units = None
+                        parsed[text] = units
+
+                if units is None:
+                    q = self.Quantity(string)
+                    magnitudes[i], units = q._magnitude, q._units
+                else:
+                    magnitudes[i] = float(match.group(1))
+            except Exception as exc:
+                errors[i] = exc
+                continue
+
+            groups.setdefault(units, []).append(i)
+
+        if to is not None:
+            dst = to_units_container(to, self)
+        elif groups:
+            dst = next(iter(groups))
+        else:
+            dst = self.UnitsContainer()
+
+        for units, indices in groups.items():
+            if units == dst:
+                continue
+            indices = np.array(indices)
+            try:
+                magnitudes[indices] = self._convert(
+                    magnitudes[indices], units, dst, inplace=True
+                )
+            except Exception as exc:
+                magnitudes[indices] = np.nan
+                for i in indices.tolist():
+                    errors[i] = exc
+
+        return self.Quantity(magnitudes, dst), dict(sorted(errors.items()))
+
+    def compile_expression(self, input_string, *variables, case_sensitive=None):
+        """Parse a mathematical expression including units once, to evaluate it
+        many times with different values of its variables.
+
+        Unit names are resolved and the subexpressions which do not depend on any
+        variable are evaluated when compiling, with the current registry settings.
+
+        Parameters
+        ----------
+        input_string : str
+            expression to compile, e.g. "rho * g * h".
+        *variables : str
+            names in the expression bound to the keyword arguments passed when
+            calling the compiled expression. They take precedence over units.
+        case_sensitive :
+             (Default value = None, which uses registry setting)
+
+        Returns
+        -------
+        CompiledExpression
+            callable taking the value of each variable as keyword arguments and
+            returning the same result as ``parse_expression(input_string, **values)``.
+
+        Examples
+        --------
+        >>> hydrostatic = ureg.compile_expression("rho * g * h", "rho", "g", "h")
+        >>> hydrostatic(rho=1000 * ureg("kg/m**3"), g=9.81 * ureg("m/s**2"), h=2 * ureg.m)
+        <Quantity(19620.0, 'kilogram / meter / second ** 2')>
+        """
+        source = input_string
+        for p in self.preprocessors:
+            input_string = p(input_string)
+
+        if not input_string:
+            quantity = self.Quantity(1)
+            func = lambda values: quantity  # noqa: E731
+        else:
+            func = _build_expression_tree(input_string).compile(
+                lambda x: self._eval_token(x, case_sensitive=case_sensitive),
+                variables,
+                lambda name, value: self.Quantity(value),
+            )
+
+        return CompiledExpression(source, variables, func)
+
+    def save(self, file, **quantities):
+        """Save several quantities to an uncompressed ``.npz`` archive, holding
+        their magnitudes and their units as metadata.
+
+        Parameters
+        ----------
+        file : str, os.PathLike or file
+            Destination. As with ``numpy.savez``, the ``.npz`` extension is appended
+            to file names that lack it.
+        **quantities : pint.Quantity
+            Quantities to save by name. ``units`` is reserved.
+        """
+        from .storage import save_quantities
+
+        save_quantities(file, quantities)
+
+    def load(self, file, mmap_mode=None):
+        """Load quantities saved by ``Quantity.save`` or ``UnitRegistry.save``.
+
+        The units are parsed by this registry, raising UndefinedUnitError if one
+        of them is not defined.
+
+        Parameters
+        ----------
+        file : str, os.PathLike or file
+        mmap_mode : {None, 'r', 'c'}
+            If not None, the magnitudes are memory-mapped with ``numpy.memmap``
+            instead of being read, so that only the parts used are loaded. This
+            requires a path. With 'c' (copy-on-write), assignments to the
+            magnitudes are not written to the file.
+
+        Returns
+        -------
+        pint.Quantity or dict of pint.Quantity
+            The quantity saved by ``Quantity.save``, or the quantities saved by
+            ``UnitRegistry.save`` by name.
+        """
+        from .storage import load_quantities
+
+        return load_quantities(self, file, mmap_mode)
+
+    def _parse_expression_key(self, input_string, case_sensitive):
+        """Return the key of the parse_expression cache, including every registry
+        setting that can change the result of evaluating input_string.
+        """
+        if case_sensitive is None:
+            case_sensitive = self.case_sensitive
+        return (
+            input_string,
+            case_sensitive,
+            self.auto_reduce_dimensions,
+            self.force_ndarray,
+            self.force_ndarray_like,
+        )
+
 
 class NonMultiplicativeRegistry(BaseRegistry):
     """Handle of non multiplicative units (e.g. Temperature).
@@ -1313,6 +2211,12 @@ class NonMultiplicativeRegistry(BaseRegistry):
 
         return super()._parse_units(input_string, as_delta, case_sensitive)
 
+    def _parse_expression_key(self, input_string, case_sensitive):
+        # Multiplying offset units depends on autoconvert_offset_to_baseunit
+        return super()._parse_expression_key(input_string, case_sensitive) + (
+            self.autoconvert_offset_to_baseunit,
+        )
+
     def _define(self, definition):
         """Add unit to the registry.
 
@@ -1397,27 +2301,23 @@ class NonMultiplicativeRegistry(BaseRegistry):
         # Otherwise, return the units unmodified
         return all_units
 
-    def _convert(self, value, src, dst, inplace=False):
-        """Convert value from some source to destination units.
+    def _build_conversion_plan(self, src, dst):
+        """Resolve the conversion between two units.
 
         In addition to what is done by the BaseRegistry,
-        converts between non-multiplicative units.
+        resolves conversions between non-multiplicative units.
 
         Parameters
         ----------
-        value :
-            value
         src : UnitsContainer
             source units.
         dst : UnitsContainer
             destination units.
-        inplace :
-             (Default value = False)
 
         Returns
         -------
-        type
-            converted value
+        tuple
+            (src_converter, factor, dst_converter)
 
         """
 
@@ -1438,39 +2338,34 @@ class NonMultiplicativeRegistry(BaseRegistry):
             )
 
         if not (src_offset_unit or dst_offset_unit):
-            return super()._convert(value, src, dst, inplace)
-
-        src_dim = self._get_dimensionality(src)
-        dst_dim = self._get_dimensionality(dst)
+            return super()._build_conversion_plan(src, dst)
 
         # If the source and destination dimensionality are different,
         # then the conversion cannot be performed.
-        if src_dim != dst_dim:
-            raise DimensionalityError(src, dst, src_dim, dst_dim)
+        if self._get_dimensionality_vector(src) != self._get_dimensionality_vector(dst):
+            raise DimensionalityError(
+                src, dst, self._get_dimensionality(src), self._get_dimensionality(dst)
+            )
+
+        src_converter = dst_converter = None
 
-        # clean src from offset units by converting to reference
+        # clean src from offset units, the value is converted to reference first
         if src_offset_unit:
-            value = self._units[src_offset_unit].converter.to_reference(value, inplace)
+            src_converter = self._units[src_offset_unit].converter
             src = src.remove([src_offset_unit])
             # Add reference unit for multiplicative section
             src = self._add_ref_of_log_unit(src_offset_unit, src)
 
-        # clean dst units from offset units
+        # clean dst units from offset units, the value is converted from reference last
         if dst_offset_unit:
+            dst_converter = self._units[dst_offset_unit].converter
             dst = dst.remove([dst_offset_unit])
             # Add reference unit for multiplicative section
             dst = self._add_ref_of_log_unit(dst_offset_unit, dst)
 
         # Convert non multiplicative units to the dst.
-        value = super()._convert(value, src, dst, inplace, False)
-
-        # Finally convert to offset units specified in destination
-        if dst_offset_unit:
-            value = self._units[dst_offset_unit].converter.from_reference(
-                value, inplace
-            )
-
-        return value
+        factor, _ = self._get_root_units(src / dst)
+        return src_converter, factor, dst_converter
 
 
 class ContextRegistry(BaseRegistry):
@@ -1559,6 +2454,27 @@ class ContextRegistry(BaseRegistry):
         super()._build_cache()
         self._caches[()] = self._cache
 
+    def _clear_definition_caches(self):
+        super()._clear_definition_caches()
+        for cache in self._caches.values():
+            cache.conversion_plans.clear()
+            cache.units_metadata.clear()
+            cache.parse_expression.clear()
+            cache.numpy_dispatch.clear()
+
+    def _snapshot_state(self):
+        state = super()._snapshot_state()
+        # Context overlays of the units are rebuilt on demand.
+        state["_units"] = self._units.maps[-1]
+        state["_contexts"] = self._contexts
+        return state
+
+    def _restore_snapshot_state(self, state):
+        super()._restore_snapshot_state(state)
+        self._units = ChainMap(self._units)
+        self._contexts = state["_contexts"]
+        self._caches[()] = self._cache
+
     def _switch_context_cache_and_units(self) -> None:
         """If any of the active contexts redefine units, create variant self._cache
         and self._units specific to the combination of active contexts.
@@ -1582,7 +2498,9 @@ class ContextRegistry(BaseRegistry):
         # First time using this specific combination of contexts and it contains
         # unit redefinitions
         base_cache = self._caches[()]
-        self._caches[key] = self._cache = ContextCacheOverlay(base_cache)
+        self._caches[key] = self._cache = ContextCacheOverlay(
+            base_cache, self._cache_sizes
+        )
 
         self._context_units[key] = units_overlay = {}
         self._units.maps.insert(0, units_overlay)
@@ -1838,6 +2756,44 @@ class ContextRegistry(BaseRegistry):
 
         return super()._convert(value, src, dst, inplace)
 
+    def _get_stream_converter(self, src, dst):
+        """Return the callable used by convert_stream to convert magnitudes.
+
+        In addition to what is done by the BaseRegistry, the transformations of the
+        active contexts between different dimensionalities are looked up once.
+        """
+        if self._active_ctx:
+            src_dim = self._get_dimensionality(src)
+            dst_dim = self._get_dimensionality(dst)
+            path = find_shortest_path(self._active_ctx.graph, src_dim, dst_dim)
+            if path:
+                steps = [
+                    (a, b, self._active_ctx[(a, b)])
+                    for a, b in zip(path[:-1], path[1:])
+                ]
+                converters = {}
+
+                def convert(value, inplace=False):
+                    q = self.Quantity(value, src)
+                    for a, b, ctx in steps:
+                        q = ctx.transform(a, b, self, q)
+                    converter = converters.get(q._units)
+                    if converter is None:
+                        converter = converters[q._units] = super(
+                            ContextRegistry, self
+                        )._get_stream_converter(q._units, dst)
+                    magnitude = q._magnitude
+                    if not inplace and HAS_NUMPY:
+                        # Transformations usually return new arrays, which are ours
+                        inplace = not np.may_share_memory(magnitude, value)
+                    return converter(
+                        magnitude, inplace=inplace and _is_inplace_safe(magnitude)
+                    )
+
+                return convert
+
+        return super()._get_stream_converter(src, dst)
+
     def _get_compatible_units(self, input_units, group_or_system):
         src_dim = self._get_dimensionality(input_units)
 
@@ -1876,7 +2832,7 @@ class SystemRegistry(BaseRegistry):
         self._systems = {}
 
         #: Maps dimensionality (UnitsContainer) to Dimensionality (UnitsContainer)
-        self._base_units_cache = dict()
+        self._base_units_cache = _new_cache(self._cache_sizes.get("base_units"))
 
         #: Map group name to group.
         #: :type: dict[ str | Group]
@@ -1916,6 +2872,28 @@ class SystemRegistry(BaseRegistry):
             "system", None
         )
 
+    def _snapshot_options(self):
+        options = super()._snapshot_options()
+        options["system"] = self._default_system
+        return options
+
+    def _snapshot_state(self):
+        state = super()._snapshot_state()
+        # Groups and systems are instances of classes built for this registry,
+        # so only their attributes are stored.
+        state["_groups"] = {name: obj.__dict__ for name, obj in self._groups.items()}
+        state["_systems"] = {name: obj.__dict__ for name, obj in self._systems.items()}
+        return state
+
+    def _restore_snapshot_state(self, state):
+        super()._restore_snapshot_state(state)
+        for attr, cls in (("_groups", self.Group), ("_systems", self.System)):
+            objs = {}
+            for name, attrs in state[attr].items():
+                obj = objs[name] = object.__new__(cls)
+                obj.__dict__.update(attrs)
+            setattr(self, attr, objs)
+
     def _register_parsers(self):
         super()._register_parsers()
         self._register_parser("@group", self._parse_group)
@@ -1967,7 +2945,7 @@ class SystemRegistry(BaseRegistry):
             if name not in self._systems:
                 raise ValueError("Unknown system %s" % name)
 
-            self._base_units_cache = {}
+            self._base_units_cache = _new_cache(self._cache_sizes.get("base_units"))
 
         self._default_system = name
 
@@ -2136,6 +3114,27 @@ class UnitRegistry(SystemRegistry, ContextRegistry, NonMultiplicativeRegistry):
         locale identifier string, used in `format_babel`. Default to None
     case_sensitive : bool, optional
         Control default case sensitivity of unit parsing. (Default: True)
+    cache_folder : str or None, optional
+        Folder where a snapshot of the parsed definitions is stored, to be reused
+        by registries created later with the same definition files and options.
+        The snapshot is a pickle file, so the folder must be trusted.
+        None disables snapshots. (Default: None)
+    lazy_cache : bool, optional
+        If True, the dimensionality and root units of each unit are computed when
+        first needed instead of when the registry is created, and the units grouped
+        by dimensionality when :meth:`get_compatible_units` is first called.
+        (Default: False)
+    cache_sizes : dict or None, optional
+        Maximum number of entries of the internal caches, by name: 'parse_unit',
+        'root_units', 'dimensionality', 'dimensionality_vectors', 'units_metadata',
+        'base_units', 'conversion_plans', 'parse_expression' and 'numpy_dispatch'.
+        When full, the least recently used entry is discarded, except for the entries
+        computed from the definition files when the registry is created. Caches not
+        listed are unbounded, except 'parse_expression' which keeps 1024 entries.
+        (Default: None)
+    lean : bool, optional
+        If True, quantities do not keep the debugging bookkeeping of
+        ``Quantity.debug_used``, making each instance smaller. (Default: False)
     """
 
     def __init__(
@@ -2152,6 +3151,10 @@ class UnitRegistry(SystemRegistry, ContextRegistry, NonMultiplicativeRegistry):
         fmt_locale=None,
         non_int_type=float,
         case_sensitive=True,
+        cache_folder=None,
+        lazy_cache=False,
+        cache_sizes=None,
+        lean=False,
     ):
 
         super().__init__(
@@ -2167,6 +3170,10 @@ class UnitRegistry(SystemRegistry, ContextRegistry, NonMultiplicativeRegistry):
             fmt_locale=fmt_locale,
             non_int_type=non_int_type,
             case_sensitive=case_sensitive,
+            cache_folder=cache_folder,
+            lazy_cache=lazy_cache,
+            cache_sizes=cache_sizes,
+            lean=lean,
         )
 
     def pi_theorem(self, quantities):
@@ -345,7 +345,11 @@ def check(ureg, *args):
                 if dim is None:
                     continue
 
-                if not ureg.Quantity(value).check(dim):
+                # Vectors are looked up on each call, as defining a base dimension
+                # changes their length
+                units = ureg.Quantity(value)._units
+                expected = ureg._get_dimensionality_vector(dim)
+                if ureg._get_dimensionality_vector(units) != expected:
                     val_dim = ureg.get_dimensionality(value)
                     raise DimensionalityError(value, "a quantity of", val_dim, dim)
             return func(*args, **kwargs)
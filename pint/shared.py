@@ -0,0 +1,183 @@
+"""
+    pint.shared
+    ~~~~~~~~~~~
+
+    :copyright: 2016 by Pint Authors, see AUTHORS for more details.
+    :license: BSD, see LICENSE for more details.
+"""
+
+import inspect
+from collections import namedtuple
+
+from .compat import HAS_NUMPY, HAS_SHARED_MEMORY, np, shared_memory
+from .util import SharedRegistryObject
+
+
+class SharedQuantityHandle(
+    namedtuple("SharedQuantityHandle", ["name", "shape", "dtype", "units"])
+):
+    """Small picklable reference to a SharedQuantity, made of the name of the
+    shared memory block and the shape, dtype and units of the magnitude.
+    """
+
+    __slots__ = ()
+
+    def attach(self):
+        """Attach to the shared memory block, without copying it.
+
+        The returned SharedQuantity is attached to the application registry and
+        does not own the block: it must be closed, but not unlinked.
+
+        Returns
+        -------
+        SharedQuantity
+        """
+        return _SharedQuantity._attach(self)
+
+
+class SharedQuantity(SharedRegistryObject):
+    """Implements a Quantity whose magnitude is an ndarray stored in a block of
+    shared memory, that other processes can attach to without copying it.
+
+    The process that creates a SharedQuantity owns the block and must unlink it
+    when it is no longer needed. Other processes attach to the block through a
+    :class:`SharedQuantityHandle`, returned by :attr:`handle`, or by unpickling the
+    SharedQuantity itself, and must only close it. Using a SharedQuantity as a
+    context manager closes it on exit, and unlinks the block if it is the owner.
+
+    Parameters
+    ----------
+    value : array_like or pint.Quantity
+        Initial magnitude, which is copied to the shared memory block.
+    units : str, UnitsContainer, pint.Unit or pint.Quantity
+        Units of the quantity. If None, the units of `value` if it is a Quantity,
+        or dimensionless.
+    dtype : data-type, optional
+        dtype of the magnitude. If None, the dtype of `value`.
+
+    """
+
+    def __init__(self, value, units=None, dtype=None):
+        if not HAS_NUMPY:
+            raise RuntimeError("Pint requires NumPy to create a SharedQuantity object.")
+        if not HAS_SHARED_MEMORY:
+            raise RuntimeError(
+                "Pint requires multiprocessing.shared_memory (Python 3.8 or later) "
+                "to create a SharedQuantity object."
+            )
+
+        if isinstance(value, self._REGISTRY.Quantity):
+            if units is None:
+                units = value._units
+                value = value._magnitude
+            else:
+                value = value.m_as(units)
+        value = np.asarray(value, dtype=dtype)
+        if value.dtype.hasobject:
+            raise TypeError("A SharedQuantity cannot hold Python objects.")
+
+        # A block can't be empty, even when the array is
+        self._shm = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+        self._owner = True
+        magnitude = np.ndarray(value.shape, value.dtype, buffer=self._shm.buf)
+        magnitude[...] = value
+        self._quantity = self._REGISTRY.Quantity(magnitude, units)
+
+    @classmethod
+    def _attach(cls, handle):
+        shm = _open_shared_memory(handle.name)
+        inst = SharedRegistryObject.__new__(cls)
+        inst._shm = shm
+        inst._owner = False
+
+        from . import _unpickle
+        from .quantity import Quantity
+
+        magnitude = np.ndarray(handle.shape, handle.dtype, buffer=shm.buf)
+        inst._quantity = _unpickle(Quantity, magnitude, handle.units)
+        return inst
+
+    def __reduce__(self):
+        # Only the handle is pickled: unpickling attaches to the same block
+        return SharedQuantityHandle.attach, (self.handle,)
+
+    def __repr__(self):
+        return "<SharedQuantity({!r}, {!r}, owner={})>".format(
+            self._shm.name, self._quantity, self._owner
+        )
+
+    @property
+    def quantity(self):
+        """Quantity whose magnitude is backed by the shared memory block."""
+        if self._quantity is None:
+            raise ValueError("The SharedQuantity is closed.")
+        return self._quantity
+
+    @property
+    def handle(self):
+        """Picklable reference to attach to the shared memory block."""
+        magnitude = self.quantity._magnitude
+        return SharedQuantityHandle(
+            self._shm.name, magnitude.shape, magnitude.dtype.str, self._quantity._units
+        )
+
+    @property
+    def owner(self):
+        """True if this SharedQuantity created the block and must unlink it."""
+        return self._owner
+
+    def close(self):
+        """Detach from the shared memory block, which remains available to the
+        other processes.
+
+        The arrays obtained from :attr:`quantity` must not be used afterwards, as
+        their memory is unmapped.
+        """
+        if self._quantity is not None:
+            self._quantity = None
+            self._shm.close()
+
+    def unlink(self):
+        """Close the SharedQuantity and destroy the shared memory block.
+
+        Only the owner can unlink the block, once all the processes are done with
+        it.
+        """
+        if not self._owner:
+            raise RuntimeError("Only the owner of a SharedQuantity can unlink it.")
+        self.close()
+        self._shm.unlink()
+        self._owner = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+def _open_shared_memory(name):
+    if not HAS_SHARED_MEMORY:
+        raise RuntimeError(
+            "Pint requires multiprocessing.shared_memory (Python 3.8 or later) "
+            "to attach to a SharedQuantity."
+        )
+
+    # Attaching processes don't own the block, so the resource tracker must not
+    # unlink it when they exit. This can only be disabled since Python 3.13.
+    if "track" in inspect.signature(shared_memory.SharedMemory).parameters:
+        return shared_memory.SharedMemory(name, track=False)
+    return shared_memory.SharedMemory(name)
+
+
+def build_shared_quantity_class(registry):
+    class SharedQuantity(_SharedQuantity):
+        _REGISTRY = registry
+
+    return SharedQuantity
+
+
+_SharedQuantity = SharedQuantity
@@ -0,0 +1,165 @@
+"""
+    pint.storage
+    ~~~~~~~~~~~~
+
+    Save quantities to and load them from NumPy ``.npz`` archives, storing their
+    units as metadata next to the magnitudes.
+
+    :copyright: 2016 by Pint Authors, see AUTHORS for more details.
+    :license: BSD, see LICENSE for more details.
+"""
+
+import json
+import os
+import struct
+import zipfile
+
+from .compat import HAS_NUMPY, np
+
+#: Name of the archive member holding the units of the quantities.
+UNITS_KEY = "units"
+
+
+def _check_numpy():
+    if not HAS_NUMPY:
+        raise RuntimeError("Pint requires NumPy to save and load quantities.")
+
+
+def _units_to_json(units):
+    return {
+        name: exponent if isinstance(exponent, int) else float(exponent)
+        for name, exponent in units.items()
+    }
+
+
+def save_quantities(file, quantities):
+    """Save quantities to an uncompressed ``.npz`` archive.
+
+    Parameters
+    ----------
+    file : str, os.PathLike or file
+        Destination. As with ``numpy.savez``, the ``.npz`` extension is appended
+        to file names that lack it.
+    quantities : pint.Quantity or dict of pint.Quantity
+        Quantity to save, or quantities to save by name.
+    """
+    _check_numpy()
+    if isinstance(quantities, dict):
+        if UNITS_KEY in quantities:
+            raise ValueError("'{}' cannot be used as a name.".format(UNITS_KEY))
+        metadata = {
+            "quantities": {
+                name: _units_to_json(q._units) for name, q in quantities.items()
+            }
+        }
+    else:
+        metadata = {"quantity": _units_to_json(quantities._units)}
+        quantities = {"magnitude": quantities}
+
+    arrays = {name: np.asarray(q._magnitude) for name, q in quantities.items()}
+    arrays[UNITS_KEY] = np.array(json.dumps(metadata))
+    np.savez(file, **arrays)
+
+
+def load_quantities(registry, file, mmap_mode=None):
+    """Load quantities saved by :func:`save_quantities`.
+
+    Parameters
+    ----------
+    registry : pint.UnitRegistry
+        Registry in which the units of the quantities are parsed.
+    file : str, os.PathLike or file
+    mmap_mode : {None, 'r', 'c'}
+        If not None, memory-map the magnitudes instead of reading them, which
+        requires a path. With 'c', assignments change the data in memory only.
+
+    Returns
+    -------
+    pint.Quantity or dict of pint.Quantity
+        Quantity, or quantities by name, as they were saved.
+    """
+    _check_numpy()
+    if mmap_mode not in (None, "r", "c"):
+        raise ValueError(
+            "mmap_mode must be None, 'r' or 'c', not {!r}".format(mmap_mode)
+        )
+
+    if mmap_mode is None:
+        with np.load(file) as npz:
+            units, single = _read_metadata(npz[UNITS_KEY])
+            magnitudes = {name: npz[name] for name in units}
+    else:
+        path = os.fspath(file)
+        with zipfile.ZipFile(path) as zf:
+            units, single = _read_metadata(np.load(zf.open(UNITS_KEY + ".npy")))
+            magnitudes = {
+                name: _memmap_member(path, zf.getinfo(name + ".npy"), mmap_mode)
+                for name in units
+            }
+
+    quantities = {
+        name: registry.Quantity(magnitudes[name], _parse_units(registry, u))
+        for name, u in units.items()
+    }
+    if single:
+        return quantities["magnitude"]
+    return quantities
+
+
+def _read_metadata(array):
+    """Return the units of each saved quantity by name, and whether the archive
+    holds a single quantity.
+    """
+    metadata = json.loads(str(array))
+    if "quantity" in metadata:
+        return {"magnitude": metadata["quantity"]}, True
+    return metadata["quantities"], False
+
+
+def _parse_units(registry, units):
+    """Build the UnitsContainer of a saved quantity, parsing each unit name so
+    that undefined units raise an UndefinedUnitError.
+    """
+    result = registry.UnitsContainer()
+    for name, exponent in units.items():
+        result *= registry._parse_units(name) ** exponent
+    return result
+
+
+def _memmap_member(path, info, mode):
+    """Memory-map an array stored in an uncompressed member of a zip archive."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(
+            "Cannot memory-map the compressed member {}.".format(info.filename)
+        )
+
+    with open(path, "rb") as fh:
+        # The data follows the local file header, which has its own lengths for
+        # the file name and the extra field.
+        fh.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", fh.read(4))
+        fh.seek(name_length + extra_length, os.SEEK_CUR)
+
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(fh)
+        elif version == (2, 0):
+            header = np.lib.format.read_array_header_2_0(fh)
+        else:
+            raise ValueError(
+                "Cannot memory-map .npy format version {}.".format(version)
+            )
+        shape, fortran_order, dtype = header
+        offset = fh.tell()
+
+    if dtype.hasobject:
+        raise ValueError("Cannot memory-map an array of Python objects.")
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mode,
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
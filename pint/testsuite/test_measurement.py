@@ -1,3 +1,5 @@
+import pickle
+
 from pint import DimensionalityError
 from pint.testsuite import QuantityTestCase, helpers
 
@@ -39,6 +41,15 @@ class TestMeasurement(QuantityTestCase):
             self.assertEqual(m.error, u)
             self.assertEqual(m.rel, m.error / abs(m.value))
 
+    def test_pickle(self):
+        m1 = self.ureg.Measurement(4.0, 0.1, "m/s")
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                m2 = pickle.loads(pickle.dumps(m1, protocol))
+                self.assertEqual(m2.value.magnitude, 4.0)
+                self.assertEqual(m2.error.magnitude, 0.1)
+                self.assertEqual(str(m2.units), "meter / second")
+
     def test_format(self):
         v, u = self.Q_(4.0, "s ** 2"), self.Q_(0.1, "s ** 2")
         m = self.ureg.Measurement(v, u)
@@ -0,0 +1,74 @@
+from pint import DimensionalityError
+from pint.compat import np
+from pint.testsuite import QuantityTestCase, helpers
+
+
+@helpers.requires_not_numpy()
+class TestNotMixedUnitArray(QuantityTestCase):
+
+    FORCE_NDARRAY = False
+
+    def test_instantiate(self):
+        self.assertRaises(RuntimeError, self.ureg.MixedUnitArray, [1.0], [0], ["meter"])
+
+
+@helpers.requires_numpy()
+class TestMixedUnitArray(QuantityTestCase):
+
+    FORCE_NDARRAY = False
+
+    def test_from_quantities(self):
+        qs = [
+            self.Q_(68.0, "degF"),
+            self.Q_(20.0, "degC"),
+            self.Q_(293.15, "K"),
+            self.Q_(25.0, "degC"),
+        ]
+        a = self.ureg.MixedUnitArray.from_quantities(qs)
+        self.assertEqual(len(a), 4)
+        np.testing.assert_array_equal(a.magnitude, [68.0, 20.0, 293.15, 25.0])
+        np.testing.assert_array_equal(a.codes, [0, 1, 2, 1])
+        self.assertEqual(a.codes.dtype, np.uint8)
+        self.assertEqual(a.units, (self.ureg.degF, self.ureg.degC, self.ureg.K))
+        self.assertEqual(a.dimensionality, self.ureg.get_dimensionality("K"))
+
+        for units in ("degC", "K", "degF"):
+            with self.subTest(units):
+                q = a.to(units)
+                self.assertEqual(q.units, self.ureg.Unit(units))
+                np.testing.assert_allclose(
+                    q.magnitude, [x.m_as(units) for x in qs], rtol=1e-12
+                )
+
+    def test_non_affine(self):
+        a = self.ureg.MixedUnitArray([10.0, 1.0, 20.0], [0, 1, 0], ["dBm", "mW"])
+        self.assertQuantityAlmostEqual(a.to("mW"), self.Q_([10.0, 1.0, 100.0], "mW"))
+        self.assertQuantityAlmostEqual(a.to("dBm"), self.Q_([10.0, 0.0, 20.0], "dBm"))
+
+    def test_indexing(self):
+        a = self.ureg.MixedUnitArray([1.0, 2.0, 3.0], [0, 1, 0], ["m", "km"])
+        self.assertEqual(a[1], self.Q_(2.0, "km"))
+
+        b = a[1:]
+        self.assertEqual(len(b), 2)
+        self.assertIs(b._units, a._units)
+        self.assertQuantityAlmostEqual(b.to("m"), self.Q_([2000.0, 3.0], "m"))
+
+        c = a[a.codes == 0]
+        self.assertQuantityAlmostEqual(c.to("cm"), self.Q_([100.0, 300.0], "cm"))
+
+    def test_masked(self):
+        magnitudes = np.ma.array([1.0, 2.0, 3.0], mask=[False, True, False])
+        a = self.ureg.MixedUnitArray(magnitudes, [0, 1, 0], ["m", "km"])
+        m = a.m_as("m")
+        np.testing.assert_array_equal(m.mask, [False, True, False])
+        self.assertEqual(m[2], 3.0)
+        self.assertIs(a[1], np.ma.masked)
+
+    def test_errors(self):
+        M_ = self.ureg.MixedUnitArray
+        self.assertRaises(DimensionalityError, M_, [1.0], [0], ["m", "s"])
+        self.assertRaises(DimensionalityError, M_([1.0], [0], ["m"]).to, "s")
+        self.assertRaises(ValueError, M_, [1.0, 2.0], [0], ["m"])
+        self.assertRaises(ValueError, M_, [1.0], [1], ["m"])
+        self.assertRaises(TypeError, M_, [1.0], [0.0], ["m"])
@@ -1247,6 +1247,48 @@ class TestNumpyUnclassified(TestNumpyMethods):
             [1, 3] * self.ureg.m,
         )
 
+    def test_dispatch_cache(self):
+        from pint import Context, UnitRegistry
+
+        ureg = UnitRegistry(force_ndarray=True)
+        ureg.define("foo = 2 meter")
+        a = ureg.Quantity([1.0, 2.0], "foo")
+        b = ureg.Quantity([100.0, 200.0], "cm")
+        for _ in range(2):
+            self.assertQuantityAlmostEqual(
+                np.maximum(b, a), ureg.Quantity([200.0, 400.0], "cm")
+            )
+            self.assertQuantityAlmostEqual(
+                np.concatenate([a, b]), ureg.Quantity([1.0, 2.0, 0.5, 1.0], "foo")
+            )
+            self.assertQuantityAlmostEqual(
+                np.sqrt(a * a), ureg.Quantity([1.0, 2.0], "foo")
+            )
+            self.assertQuantityEqual(np.sum(a, axis=0), ureg.Quantity(3.0, "foo"))
+            self.assertNDArrayEqual(np.isnan(a), [False, False])
+            self.assertRaises(DimensionalityError, np.maximum, a, ureg.Quantity(1, "s"))
+        self.assertEqual(len(ureg._cache.numpy_dispatch), 5)
+
+        # Conversions use the redefinitions of the active contexts
+        ctx = Context("ctx")
+        ctx.redefine("foo = 3 meter")
+        ureg.add_context(ctx)
+        with ureg.context("ctx"):
+            self.assertQuantityAlmostEqual(
+                np.maximum(b, a), ureg.Quantity([300.0, 600.0], "cm")
+            )
+        self.assertQuantityAlmostEqual(
+            np.maximum(b, a), ureg.Quantity([200.0, 400.0], "cm")
+        )
+
+        # Entries are discarded when units are defined
+        ureg.define("quux = 4 meter")
+        self.assertEqual(len(ureg._cache.numpy_dispatch), 0)
+        self.assertQuantityAlmostEqual(
+            np.maximum(ureg.Quantity([1.0, 2.0], "quux"), a),
+            ureg.Quantity([1.0, 2.0], "quux"),
+        )
+
 
 @unittest.skip
 class TestBitTwiddlingUfuncs(TestUFuncs):
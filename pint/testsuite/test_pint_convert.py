@@ -0,0 +1,101 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import pint
+
+SCRIPT = os.path.join(os.path.dirname(pint.__file__), "pint-convert")
+
+
+def script_env():
+    """Environment in which the script imports this copy of pint."""
+    env = dict(os.environ)
+    paths = [os.path.dirname(os.path.dirname(pint.__file__))]
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    return env
+
+
+def run(*args, input=None):
+    return subprocess.run(
+        [sys.executable, SCRIPT, "-U"] + list(args),
+        input=input,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=script_env(),
+        timeout=120,
+    )
+
+
+@unittest.skipUnless(os.path.exists(SCRIPT), "requires the pint-convert script")
+class TestPintConvert(unittest.TestCase):
+    def test_convert(self):
+        result = run("1 km", "m")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "1 kilometer = 1000 m\n")
+
+    def test_batch(self):
+        result = run("--batch", input='1km m\n1 km m\n\n"1 km"\n')
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "1 kilometer = 1000 m\n" * 3)
+        self.assertEqual(result.stderr, "")
+
+    def test_batch_errors(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "lines.txt")
+            with open(path, "w") as f:
+                f.write("1 m s\n2 km m\n'1 m\n")
+            result = run("--batch", path)
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stdout, "2 kilometer = 2000 m\n")
+        errors = result.stderr.splitlines()
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0].startswith("Error: Cannot convert"))
+        self.assertTrue(errors[1].startswith("Error: "))
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires UNIX sockets")
+    def test_serve_not_a_socket(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "notasocket")
+            with open(path, "w") as f:
+                f.write("important\n")
+            result = run("--serve", path)
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("is not a socket", result.stderr)
+            with open(path) as f:
+                self.assertEqual(f.read(), "important\n")
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires UNIX sockets")
+    def test_serve_connect(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "pint.sock")
+            server = subprocess.Popen(
+                [sys.executable, SCRIPT, "-U", "--serve", path], env=script_env()
+            )
+            try:
+                deadline = time.time() + 120
+                while not os.path.exists(path):
+                    self.assertIsNone(server.poll())
+                    self.assertLess(time.time(), deadline)
+                    time.sleep(0.05)
+
+                result = run("--connect", path, "1 km", "m")
+                self.assertEqual(result.returncode, 0)
+                self.assertEqual(result.stdout, "1 kilometer = 1000 m\n")
+
+                result = run("--connect", path, "--batch", input="2 km m\n1 m s\n")
+                self.assertEqual(result.returncode, 1)
+                self.assertEqual(result.stdout, "2 kilometer = 2000 m\n")
+                self.assertTrue(result.stderr.startswith("Error: Cannot convert"))
+            finally:
+                server.send_signal(signal.SIGINT)
+                server.wait(timeout=60)
+            self.assertFalse(os.path.exists(path))
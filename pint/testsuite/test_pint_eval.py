@@ -66,3 +66,24 @@ class TestPintEval(unittest.TestCase):
         # units should behave like numbers, so we don't need a bunch of extra tests for them
         # implicit op, then addition
         self._test_one("3 kg + 5", "((3 kg) + 5)")
+
+    def test_compile(self):
+        calls = []
+
+        def define_op(token):
+            calls.append(token[1])
+            return float(token[1]) if token[1][0].isdigit() else 10.0
+
+        tree = build_eval_tree(tokenizer("(2 + 3) * x - y / 4 + z"))
+        func = tree.compile(define_op, ("x", "y"))
+        # Constant operands are translated and folded once
+        self.assertEqual(calls, ["2", "3", "4", "z"])
+        self.assertEqual(func({"x": 1.0, "y": 8.0}), 13.0)
+        self.assertEqual(func({"x": 2.0, "y": 4.0}), 19.0)
+        self.assertEqual(len(calls), 4)
+
+        func = tree.compile(define_op, ("x", "y"), lambda name, value: -value)
+        self.assertEqual(func({"x": 1.0, "y": 8.0}), 7.0)
+
+        func = build_eval_tree(tokenizer("2 * 3")).compile(define_op, ("x",))
+        self.assertEqual(func({}), 6.0)
@@ -3,10 +3,18 @@ import datetime
 import math
 import operator as op
 import pickle
+import sys
+import unittest
 import warnings
+from decimal import Decimal
 from unittest.mock import patch
 
-from pint import DimensionalityError, OffsetUnitCalculusError, UnitRegistry
+from pint import (
+    DimensionalityError,
+    OffsetUnitCalculusError,
+    QuantityBatch,
+    UnitRegistry,
+)
 from pint.compat import np
 from pint.testsuite import QuantityTestCase, helpers
 from pint.testsuite.parameterized import ParameterizedTestCase
@@ -50,6 +58,37 @@ class TestQuantity(QuantityTestCase):
             self.assertEqual(4.2 * self.ureg.meter, self.Q_(4.2, 2 * self.ureg.meter))
             self.assertEqual(len(buffer), 1)
 
+    def test_quantity_slots(self):
+        lean_ureg = UnitRegistry(lean=True)
+        x = self.Q_(4.2, "meter")
+        y = lean_ureg.Quantity(4.2, "meter")
+        for q in (x, y):
+            self.assertFalse(hasattr(q, "__dict__"))
+            self.assertRaises(AttributeError, setattr, q, "foo", 1)
+            self.assertFalse(q.debug_used)
+            self.assertFalse(copy.copy(q).debug_used)
+            self.assertEqual(q.dimensionality, UnitsContainer({"[length]": 1}))
+        self.assertLess(sys.getsizeof(y), sys.getsizeof(x))
+        self.assertEqual(y.to("cm"), lean_ureg.Quantity(420.0, "cm"))
+        z = pickle.loads(pickle.dumps(y))
+        self.assertFalse(hasattr(z, "__dict__"))
+        self.assertEqual(z.magnitude, 4.2)
+
+    def test_from_trusted(self):
+        units = UnitsContainer(meter=1)
+        x = self.Q_._from_trusted(4.2, units)
+        self.assertIsInstance(x, self.Q_)
+        self.assertEqual(x, self.Q_(4.2, units))
+        self.assertIs(x._units, self.Q_(1, "meter")._units)
+        self.assertIs(x._REGISTRY, self.ureg)
+
+    @helpers.requires_numpy()
+    def test_from_trusted_force_ndarray(self):
+        ureg = UnitRegistry(force_ndarray=True)
+        x = ureg.Quantity._from_trusted(4.2, UnitsContainer(meter=1))
+        self.assertIsInstance(x.magnitude, np.ndarray)
+        self.assertIsInstance(x[()].magnitude, np.ndarray)
+
     def test_quantity_bool(self):
         self.assertTrue(self.Q_(1, None))
         self.assertTrue(self.Q_(1, "meter"))
@@ -500,6 +539,35 @@ class TestQuantity(QuantityTestCase):
                     q2 = pickle.loads(pickle.dumps(q1, protocol))
                     self.assertEqual(q1, q2)
 
+    def test_pickle_batch(self):
+        qs = [self.Q_(1, "m"), self.Q_(2.5, "km/s"), self.Q_(3, "m"), self.Q_(4, "")]
+        b1 = QuantityBatch(qs)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                b2 = pickle.loads(pickle.dumps(b1, protocol))
+                self.assertIsInstance(b2, QuantityBatch)
+                self.assertEqual(len(b2), len(qs))
+                for q1, q2 in zip(qs, b2):
+                    self.assertEqual(q2.magnitude, q1.magnitude)
+                    self.assertEqual(str(q2.units), str(q1.units))
+                self.assertIs(b2[0]._units, b2[2]._units)
+
+        self.assertRaises(TypeError, pickle.dumps, QuantityBatch([1, self.Q_(1, "m")]))
+
+    @helpers.requires_numpy()
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "requires pickle protocol 5")
+    def test_pickle_out_of_band(self):
+        q1 = self.Q_(np.arange(1000.0), "m/s")
+        buffers = []
+        data = pickle.dumps(q1, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), q1.magnitude.nbytes)
+
+        q2 = pickle.loads(data, buffers=buffers)
+        self.assertEqual(str(q2.units), str(q1.units))
+        np.testing.assert_array_equal(q2.magnitude, q1.magnitude)
+        self.assertTrue(np.shares_memory(q2.magnitude, q1.magnitude))
+
     @helpers.requires_numpy()
     def test_from_sequence(self):
         u_array_ref = self.Q_([200, 1000], "g")
@@ -524,6 +592,23 @@ class TestQuantity(QuantityTestCase):
         u_array_5 = self.Q_.from_list(u_seq)
         self.assertTrue(all(u_array_5 == u_array_ref))
 
+        t_seq = [self.Q_(20, "degC"), self.Q_(300.0, "K"), self.Q_(50.0, "degF")] * 2
+        t_array = self.Q_.from_sequence(t_seq, "degC")
+        self.assertEqual(t_array.u, self.ureg.degC)
+        np.testing.assert_array_equal(
+            t_array.m, [q.m_as("degC") for q in t_seq],
+        )
+
+        with self.assertRaises(DimensionalityError):
+            self.Q_.from_sequence([self.Q_(1, "m"), self.Q_(1, "s")])
+
+        # Decimal magnitudes are converted element by element
+        d_array = self.Q_.from_sequence(
+            [self.Q_(Decimal("1.5"), "km"), self.Q_(1.0, "m")], "m"
+        )
+        np.testing.assert_array_equal(d_array.m, [1500.0, 1.0])
+        self.assertEqual(d_array.u, self.ureg.m)
+
     @helpers.requires_numpy()
     def test_iter(self):
         # Verify that iteration gives element as Quantity with same units
@@ -1550,6 +1635,18 @@ class TestOffsetUnitMath(QuantityTestCase, ParameterizedTestCase):
         self.assertQuantityEqual(A @ b, [[1], [3]] * self.ureg.m ** 2)
         self.assertQuantityEqual(B @ b, [[0], [-1]] * self.ureg.m)
 
+    def test_muldiv_multiplicative_skips_offset_checks(self):
+        q = self.Q_(2.0, "m")
+        with patch.object(self.Q_, "_ok_for_muldiv") as ok_for_muldiv:
+            self.assertEqual(q * self.Q_(3.0, "s"), self.Q_(6.0, "m * s"))
+            self.assertEqual(q / 2, self.Q_(1.0, "m"))
+            self.assertEqual(2 / q, self.Q_(1.0, "1 / m"))
+            q *= self.Q_(3.0, "s")
+            self.assertFalse(ok_for_muldiv.called)
+
+            self.Q_(2.0, "degC") * 3
+            self.assertTrue(ok_for_muldiv.called)
+
 
 class TestDimensionReduction(QuantityTestCase):
     def _calc_mass(self, ureg):
@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+from pint.compat import HAS_SHARED_MEMORY, np
+from pint.testsuite import QuantityTestCase, helpers
+
+
+@helpers.requires_not_numpy()
+class TestNotSharedQuantity(QuantityTestCase):
+
+    FORCE_NDARRAY = False
+
+    def test_instantiate(self):
+        self.assertRaises(RuntimeError, self.ureg.SharedQuantity, [1.0], "m")
+
+
+@helpers.requires_numpy()
+@unittest.skipUnless(HAS_SHARED_MEMORY, "requires multiprocessing.shared_memory")
+class TestSharedQuantity(QuantityTestCase):
+
+    FORCE_NDARRAY = False
+
+    def test_create(self):
+        with self.ureg.SharedQuantity(np.arange(4.0), "m") as sq:
+            self.assertTrue(sq.owner)
+            self.assertQuantityEqual(sq.quantity, self.Q_(np.arange(4.0), "m"))
+
+            h = sq.handle
+            self.assertEqual(h.shape, (4,))
+            self.assertEqual(np.dtype(h.dtype), np.float64)
+
+        self.assertFalse(sq.owner)
+        self.assertRaises(ValueError, getattr, sq, "quantity")
+        self.assertRaises(FileNotFoundError, h.attach)
+
+    def test_from_quantity(self):
+        q = self.Q_([1, 2], "km")
+        with self.ureg.SharedQuantity(q) as sq:
+            self.assertQuantityEqual(sq.quantity, q)
+        with self.ureg.SharedQuantity(q, "m", dtype=float) as sq:
+            self.assertQuantityEqual(sq.quantity, self.Q_([1000.0, 2000.0], "m"))
+
+    def test_attach(self):
+        with self.ureg.SharedQuantity(np.zeros(3), "m/s") as sq:
+            for other in (
+                pickle.loads(pickle.dumps(sq.handle)).attach(),
+                pickle.loads(pickle.dumps(sq)),
+            ):
+                with other:
+                    self.assertFalse(other.owner)
+                    self.assertEqual(str(other.quantity.units), "meter / second")
+                    self.assertRaises(RuntimeError, other.unlink)
+
+                    # Both share the same memory
+                    other.quantity.magnitude[1] = 5.0
+                    self.assertEqual(sq.quantity.magnitude[1], 5.0)
+                    sq.quantity.magnitude[2] = 7.0
+                    self.assertEqual(other.quantity.magnitude[2], 7.0)
+
+            # Closing an attached SharedQuantity doesn't destroy the block
+            self.assertEqual(sq.quantity.magnitude[1], 5.0)
+
+    def test_errors(self):
+        self.assertRaises(
+            TypeError, self.ureg.SharedQuantity, np.array([1, "a"], dtype=object)
+        )
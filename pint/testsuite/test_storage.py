@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+from pint import UndefinedUnitError, UnitRegistry
+from pint.compat import np
+from pint.testsuite import QuantityTestCase, helpers
+
+
+@helpers.requires_not_numpy()
+class TestNotStorage(QuantityTestCase):
+    def test_save(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "q.npz")
+            self.assertRaises(RuntimeError, self.Q_(1, "m").save, path)
+
+
+@helpers.requires_numpy()
+class TestStorage(QuantityTestCase):
+
+    FORCE_NDARRAY = False
+
+    def setUp(self):
+        super().setUp()
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+
+    def test_save_load(self):
+        q = self.Q_(np.arange(12.0).reshape(3, 4), "km/s**2")
+        q.save(os.path.join(self.folder, "q"))
+        path = os.path.join(self.folder, "q.npz")
+
+        for mmap_mode in (None, "r", "c"):
+            with self.subTest(mmap_mode=mmap_mode):
+                q2 = self.ureg.load(path, mmap_mode=mmap_mode)
+                self.assertQuantityEqual(q2, q)
+                self.assertEqual(q2.magnitude.shape, (3, 4))
+                self.assertEqual(isinstance(q2.magnitude, np.memmap), bool(mmap_mode))
+                del q2
+
+        self.assertRaises(ValueError, self.ureg.load, path, mmap_mode="r+")
+
+    def test_save_load_many(self):
+        quantities = {
+            "distance": self.Q_(np.asfortranarray(np.ones((2, 3))), "m"),
+            "temperature": self.Q_(np.array([20.0, 25.0]), "degC"),
+            "power": self.Q_(3.0, "dBm"),
+            "ratio": self.Q_(np.array([1, 2]), ""),
+            "area": self.Q_(np.array([4.0]), "m ** 1.5"),
+        }
+        path = os.path.join(self.folder, "many.npz")
+        self.ureg.save(path, **quantities)
+
+        for mmap_mode in (None, "r"):
+            with self.subTest(mmap_mode=mmap_mode):
+                loaded = self.ureg.load(path, mmap_mode=mmap_mode)
+                self.assertEqual(sorted(loaded), sorted(quantities))
+                for name, q in quantities.items():
+                    self.assertQuantityEqual(loaded[name], q)
+                del loaded
+
+        self.assertRaises(ValueError, self.ureg.save, path, units=self.Q_(1, "m"))
+
+    def test_undefined_units(self):
+        ureg = UnitRegistry()
+        ureg.define("widget = [widget]")
+        path = os.path.join(self.folder, "widgets.npz")
+        ureg.Quantity(np.arange(3), "kilowidget").save(path)
+
+        self.assertEqual(ureg.load(path).units, ureg.kilowidget)
+        for mmap_mode in (None, "r"):
+            with self.subTest(mmap_mode=mmap_mode):
+                self.assertRaises(UndefinedUnitError, self.ureg.load, path, mmap_mode)
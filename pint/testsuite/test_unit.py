@@ -1,9 +1,13 @@
 import copy
 import functools
 import math
+import os
 import re
+import tempfile
+from decimal import Decimal
 
 from pint import (
+    Context,
     DefinitionSyntaxError,
     DimensionalityError,
     RedefinitionError,
@@ -230,6 +234,341 @@ class TestRegistry(QuantityTestCase):
             ValueError, UnitRegistry(None).load_definitions, "notexisting"
         )
 
+    def test_cache_folder(self):
+        with tempfile.TemporaryDirectory() as folder:
+            ureg1 = UnitRegistry(cache_folder=folder)
+            self.assertEqual(len(os.listdir(folder)), 1)
+
+            ureg2 = UnitRegistry(cache_folder=folder)
+            self.assertEqual(dir(ureg1), dir(ureg2))
+            self.assertEqual(
+                ureg2.Quantity(1, "km").to("mile").magnitude,
+                ureg1.Quantity(1, "km").to("mile").magnitude,
+            )
+            self.assertEqual(
+                ureg2.Quantity(10, "degC").to("kelvin").magnitude,
+                ureg1.Quantity(10, "degC").to("kelvin").magnitude,
+            )
+            self.assertEqual(
+                {str(u) for u in ureg2.get_compatible_units("meter")},
+                {str(u) for u in ureg1.get_compatible_units("meter")},
+            )
+            with ureg2.context("sp"):
+                self.assertAlmostEqual(
+                    ureg2.Quantity(500, "nm").to("THz").magnitude, 599.584916
+                )
+            self.assertEqual(
+                ureg2.get_group("root").members, ureg1.get_group("root").members
+            )
+            self.assertEqual(
+                str(ureg2.get_base_units("meter", system="imperial")),
+                str(ureg1.get_base_units("meter", system="imperial")),
+            )
+
+            # Different options require a different snapshot
+            UnitRegistry(cache_folder=folder, non_int_type=Decimal)
+            self.assertEqual(len(os.listdir(folder)), 2)
+
+    def test_cache_folder_rebuild(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "units.txt")
+            cache_folder = os.path.join(folder, "cache")
+            with open(filename, "w") as fp:
+                fp.write("meter = [length]\nfoot = 0.3048 meter\n")
+            ureg = UnitRegistry(filename, cache_folder=cache_folder)
+            self.assertAlmostEqual(ureg.Quantity(1, "foot").m_as("meter"), 0.3048)
+
+            with open(filename, "w") as fp:
+                fp.write("meter = [length]\nfoot = 0.5 meter\n")
+            ureg = UnitRegistry(filename, cache_folder=cache_folder)
+            self.assertAlmostEqual(ureg.Quantity(1, "foot").m_as("meter"), 0.5)
+
+            # A corrupted snapshot is ignored
+            for name in os.listdir(cache_folder):
+                with open(os.path.join(cache_folder, name), "wb") as fp:
+                    fp.write(b"garbage")
+            ureg = UnitRegistry(filename, cache_folder=cache_folder)
+            self.assertAlmostEqual(ureg.Quantity(1, "foot").m_as("meter"), 0.5)
+
+    def test_lazy_cache(self):
+        ureg = UnitRegistry(lazy_cache=True)
+        self.assertFalse(ureg._cache.root_units)
+        self.assertFalse(ureg._cache.dimensional_equivalents)
+
+        self.assertAlmostEqual(ureg.Quantity(1, "km").m_as("mile"), 0.621371192)
+        # Only the units involved in the conversion are cached
+        self.assertLess(len(ureg._cache.root_units), 10)
+        self.assertFalse(ureg._cache.dimensional_equivalents)
+
+        eager = UnitRegistry()
+        for units in ("meter", "kelvin", "joule"):
+            self.assertEqual(
+                {str(u) for u in ureg.get_compatible_units(units)},
+                {str(u) for u in eager.get_compatible_units(units)},
+            )
+        with ureg.context("sp"), eager.context("sp"):
+            self.assertEqual(
+                {str(u) for u in ureg.get_compatible_units("nm")},
+                {str(u) for u in eager.get_compatible_units("nm")},
+            )
+
+    def test_cache_sizes(self):
+        ureg = UnitRegistry(cache_sizes={"parse_unit": 2, "root_units": 50})
+        pinned = len(ureg._cache.root_units)
+        self.assertGreater(pinned, 50)
+
+        for name in ("km", "cm", "mm", "kg", "mg", "ms"):
+            ureg.parse_units(name)
+            ureg.get_root_units(name + "**2")
+        self.assertEqual(len(ureg._cache.parse_unit), 2)
+        self.assertLessEqual(len(ureg._cache.root_units), pinned + 50)
+        # Entries from the definition files are kept
+        self.assertIn(ParserHelper.from_word("meter"), ureg._cache.root_units)
+        self.assertEqual(str(ureg.parse_units("km")), "kilometer")
+
+        self.assertRaises(ValueError, UnitRegistry, cache_sizes={"unknown": 1})
+
+    def test_conversion_plans(self):
+        ureg = UnitRegistry(on_redefinition="ignore")
+        ureg.define("foo = 2 meter")
+        src, dst = UnitsContainer(foo=1), UnitsContainer(meter=1)
+        self.assertEqual(ureg.convert(1, src, dst), 2)
+        self.assertIn((src, dst), ureg._cache.conversion_plans)
+        self.assertEqual(ureg.convert(3, src, dst), 6)
+
+        ctx = Context("ctx")
+        ctx.redefine("foo = 3 meter")
+        ureg.add_context(ctx)
+        with ureg.context("ctx"):
+            self.assertEqual(ureg.convert(1, src, dst), 3)
+        self.assertEqual(ureg.convert(1, src, dst), 2)
+
+        # Plans are discarded when units are defined
+        ureg.define("quux = 4 meter")
+        self.assertNotIn((src, dst), ureg._cache.conversion_plans)
+        self.assertEqual(ureg.convert(1, src, UnitsContainer(quux=1)), 0.5)
+
+        src = UnitsContainer(degree_Celsius=1)
+        dst = UnitsContainer(degree_Fahrenheit=1)
+        self.assertAlmostEqual(ureg.convert(100, src, dst), 212)
+        self.assertAlmostEqual(ureg.convert(0, src, dst), 32)
+        self.assertRaises(
+            DimensionalityError, ureg.convert, 1, src, UnitsContainer(meter=1)
+        )
+
+        # Errors are not chained to the cache miss
+        with self.assertRaises(DimensionalityError) as cm:
+            (1 * ureg.inch / ureg.minute).to("joule")
+        self.assertIsNone(cm.exception.__context__)
+
+    def test_parse_expression_cache(self):
+        ureg = UnitRegistry()
+        q = ureg.parse_expression("9.81 m/s**2")
+        self.assertEqual(len(ureg._cache.parse_expression), 1)
+        self.assertEqual(ureg.parse_expression("9.81 m/s**2"), q)
+
+        # Cached results are not shared with the caller
+        q.ito("cm/s**2")
+        self.assertEqual(str(ureg("9.81 m/s**2").units), "meter / second ** 2")
+
+        # Values and registry settings are honoured
+        self.assertEqual(ureg.parse_expression("2 * x meter", x=3), 6 * ureg.meter)
+        self.assertEqual(ureg.parse_expression("2 * x meter", x=4), 8 * ureg.meter)
+        self.assertEqual(str(ureg("m * km").units), "kilometer * meter")
+        ureg.auto_reduce_dimensions = True
+        self.assertEqual(str(ureg("m * km").units), "kilometer ** 2")
+
+        # Results are discarded when units are defined
+        with self.assertRaises(UndefinedUnitError) as cm:
+            ureg("2 quux")
+        # Errors are not chained to the cache miss
+        self.assertIsNone(cm.exception.__context__)
+        ureg.define("quux = 4 meter")
+        self.assertEqual(len(ureg._cache.parse_expression), 0)
+        self.assertEqual(ureg("2 quux").to("meter").magnitude, 8)
+
+        ureg = UnitRegistry(cache_sizes={"parse_expression": 2})
+        for expr in ("1 m", "2 m", "3 m"):
+            ureg(expr)
+        self.assertEqual(
+            [key[0] for key in ureg._cache.parse_expression], ["2 m", "3 m"]
+        )
+
+    def test_compile_expression(self):
+        ureg = UnitRegistry()
+        expr = ureg.compile_expression("rho * g * h", "rho", "g", "h")
+        self.assertEqual(expr.variables, ("rho", "g", "h"))
+        for values in (
+            dict(rho=2, g=3, h=4),
+            dict(rho=ureg("1000 kg/m**3"), g=ureg("9.81 m/s**2"), h=ureg("2 m")),
+        ):
+            self.assertEqual(expr(**values), ureg.parse_expression("rho*g*h", **values))
+
+        expr = ureg.compile_expression("2 * x km / (3 s)", "x")
+        self.assertEqual(expr(x=3), ureg("2 * x km / (3 s)", x=3))
+        self.assertRaises(TypeError, expr)
+        self.assertRaises(TypeError, expr, x=1, y=2)
+
+        expr = ureg.compile_expression("9.81 m/s**2")
+        q = expr()
+        q.ito("cm/s**2")
+        self.assertEqual(expr(), ureg("9.81 m/s**2"))
+        self.assertEqual(ureg.compile_expression("")(), 1)
+        self.assertRaises(UndefinedUnitError, ureg.compile_expression, "2 * quux")
+
+    def test_dimensionality_vector(self):
+        ureg = UnitRegistry()
+        dims = ureg.base_dimensions
+        self.assertEqual(dims[:2], ("[length]", "[time]"))
+
+        vector = ureg.get_dimensionality_vector("km/hour")
+        self.assertEqual(len(vector), len(dims))
+        expected = dict.fromkeys(dims, 0)
+        expected.update(ureg.get_dimensionality("km/hour"))
+        self.assertEqual(dict(zip(dims, vector)), expected)
+        self.assertEqual(vector, ureg.get_dimensionality_vector("[length]/[time]"))
+        self.assertEqual(vector, ureg.get_dimensionality_vector(ureg.Quantity("m/s")))
+        self.assertEqual(ureg.get_dimensionality_vector(""), (0,) * len(dims))
+
+        # New base dimensions extend all vectors
+        ureg.define("quux = [quux]")
+        self.assertEqual(ureg.base_dimensions, dims + ("[quux]",))
+        self.assertEqual(ureg.get_dimensionality_vector("km/hour"), vector + (0,))
+        self.assertEqual(
+            ureg.get_dimensionality_vector("quux/s"),
+            (0, -1) + (0,) * (len(dims) - 2) + (1,),
+        )
+
+    def test_units_metadata(self):
+        ureg = UnitRegistry(on_redefinition="ignore")
+
+        def metadata(units):
+            return ureg._get_units_metadata(ureg.parse_units(units)._units)
+
+        self.assertEqual(metadata("m/s"), ((), ()))
+        self.assertEqual(metadata("degC"), (("degree_Celsius",), ()))
+        self.assertEqual(metadata("delta_degC/s"), ((), ("delta_degree_Celsius",)))
+        self.assertEqual(metadata("dBm"), (("decibelmilliwatt",), ()))
+        self.assertIs(metadata("m/s"), metadata("m/s"))
+        self.assertTrue(ureg.Quantity(1, "m/s")._is_multiplicative)
+
+        # Redefinitions clear the cache
+        ureg.define("quux = meter")
+        self.assertEqual(metadata("quux"), ((), ()))
+        ureg.define("quux = kelvin; offset: 1")
+        self.assertEqual(metadata("quux"), (("quux",), ()))
+        self.assertFalse(ureg.Quantity(1, "quux")._is_multiplicative)
+
+    def test_get_converter(self):
+        ureg = UnitRegistry()
+        conv = ureg.get_converter("km/hour", "m/s")
+        self.assertAlmostEqual(conv(36), 10)
+        self.assertEqual(conv(36), ureg.convert(36, "km/hour", "m/s"))
+
+        conv = ureg.get_converter("degC", "degF")
+        self.assertAlmostEqual(conv(100), 212)
+        self.assertAlmostEqual(conv(-40), -40)
+
+        conv = ureg.get_converter("dBm", "mW")
+        self.assertAlmostEqual(conv(10), 10)
+        self.assertEqual(conv(10), ureg.convert(10, "dBm", "mW"))
+
+        conv = ureg.get_converter("km", "m")
+        self.assertEqual(conv(Decimal("1.5")), Decimal("1500.0"))
+
+        self.assertRaises(DimensionalityError, ureg.get_converter, "m", "s")
+        self.assertRaises(DimensionalityError, ureg.get_converter, "degC*degK", "K")
+
+    @helpers.requires_numpy()
+    def test_get_converter_array(self):
+        ureg = UnitRegistry()
+        conv = ureg.get_converter("degC", "kelvin")
+        values = np.array([0.0, 100.0])
+        expected = np.array([273.15, 373.15])
+
+        np.testing.assert_allclose(conv(values), expected)
+        np.testing.assert_allclose(values, [0.0, 100.0])
+
+        out = np.empty(2)
+        self.assertIs(conv(values, out=out), out)
+        np.testing.assert_allclose(out, expected)
+        np.testing.assert_allclose(values, [0.0, 100.0])
+
+        self.assertIs(conv(values, inplace=True), values)
+        np.testing.assert_allclose(values, expected)
+
+        conv = ureg.get_converter("dB", "dimensionless")
+        values = np.array([0.0, 10.0])
+        self.assertIs(conv(values, out=out), out)
+        np.testing.assert_allclose(out, [1.0, 10.0])
+
+    def test_convert_stream(self):
+        ureg = UnitRegistry()
+        stream = ureg.convert_stream(iter([0, 100, -40.0]), "degC", "degF")
+        for value, expected in zip(stream, [32, 212, -40]):
+            self.assertAlmostEqual(value, expected)
+
+        self.assertEqual(list(ureg.convert_stream([], "m", "km")), [])
+        self.assertRaises(DimensionalityError, ureg.convert_stream, [1], "m", "s")
+
+    @helpers.requires_numpy()
+    def test_convert_stream_chunks(self):
+        ureg = UnitRegistry()
+        values = np.array([0.0, 100.0])
+        chunks = list(
+            ureg.convert_stream([1, 2, values, 3, 4, 5], "degC", "K", chunk_size=2)
+        )
+        self.assertEqual([len(c) for c in chunks], [2, 2, 2, 1])
+        np.testing.assert_allclose(
+            np.concatenate(chunks),
+            [274.15, 275.15, 273.15, 373.15, 276.15, 277.15, 278.15],
+        )
+        np.testing.assert_allclose(values, [0.0, 100.0])
+
+        chunks = list(ureg.convert_stream([values], "degC", "K", inplace=True))
+        self.assertIs(chunks[0], values)
+        np.testing.assert_allclose(values, [273.15, 373.15])
+
+        # Integer arrays can't store the result
+        values = np.array([1, 2])
+        chunks = list(ureg.convert_stream([values], "km", "m", inplace=True))
+        np.testing.assert_allclose(chunks[0], [1000, 2000])
+        np.testing.assert_array_equal(values, [1, 2])
+
+        chunks = list(ureg.convert_stream([10.0, 20.0], "dBm", "mW", chunk_size=8))
+        np.testing.assert_allclose(chunks[0], [10.0, 100.0])
+
+        with ureg.context("sp"):
+            stream = ureg.convert_stream([500.0, 600.0], "nm", "THz", chunk_size=2)
+        np.testing.assert_allclose(next(stream), [599.584916, 499.654097])
+
+        self.assertRaises(ValueError, ureg.convert_stream, [1], "m", "km", chunk_size=0)
+
+    @helpers.requires_numpy()
+    def test_parse_many(self):
+        ureg = UnitRegistry()
+        q, errors = ureg.parse_many(["12.5 km", "300 m", " 0.2 mi ", "1e3mm", "-.5km"])
+        self.assertEqual(q.units, ureg.km)
+        np.testing.assert_allclose(q.magnitude, [12.5, 0.3, 0.3218688, 0.001, -0.5])
+        self.assertEqual(errors, {})
+
+        q, errors = ureg.parse_many(["20 degC", "68 degF", "2 m/s * s"], to="K")
+        self.assertEqual(q.units, ureg.K)
+        np.testing.assert_allclose(q.magnitude[:2], [293.15, 293.15])
+        self.assertEqual(list(errors), [2])
+        self.assertIsInstance(errors[2], DimensionalityError)
+
+        strings = ["1 m", "foo", "2 s", "3 * 4 m", "", "5 km"]
+        q, errors = ureg.parse_many(strings, to="m")
+        np.testing.assert_allclose(q.magnitude, [1, np.nan, np.nan, 12, np.nan, 5000])
+        self.assertEqual(list(errors), [1, 2, 4])
+        self.assertIsInstance(errors[1], UndefinedUnitError)
+        self.assertIsInstance(errors[2], DimensionalityError)
+
+        q, errors = ureg.parse_many([])
+        self.assertEqual(q.magnitude.shape, (0,))
+        self.assertEqual(q.units, ureg.dimensionless)
+
     def test_default_format(self):
         ureg = UnitRegistry()
         q = ureg.meter
@@ -276,6 +615,12 @@ class TestRegistry(QuantityTestCase):
             self.Q_(1, UnitsContainer(kilometer=1.0)),
         )
 
+    def test_parse_new_prefix(self):
+        ureg = UnitRegistry()
+        ureg.define("myria- = 1e4 = my-")
+        self.assertEqual(ureg.parse_unit_name("myriameters"), (("myria", "meter", ""),))
+        self.assertEqual(ureg.parse_unit_name("mym"), (("myria", "meter", ""),))
+
     def test_parse_complex(self):
         self.assertEqual(
             self.ureg.parse_expression("kilometre"),
@@ -586,6 +931,17 @@ class TestRegistry(QuantityTestCase):
         self.assertRaises(TypeError, ureg.check("[speed]"), gfunc)
         self.assertRaises(TypeError, ureg.check("[speed]", "[time]", "[mass]"), gfunc)
 
+    def test_check_new_base_dimension(self):
+        ureg = UnitRegistry()
+
+        def func(x):
+            return x
+
+        f0 = ureg.check("[length]")(func)
+        ureg.define("widget = [widget]")
+        self.assertEqual(f0(1 * ureg.meter), 1 * ureg.meter)
+        self.assertRaises(DimensionalityError, f0, 1 * ureg.widget)
+
     def test_to_ref_vs_to(self):
         self.ureg.autoconvert_offset_to_baseunit = True
         q = 8.0 * self.ureg.inch
@@ -704,6 +1060,41 @@ class TestRegistry(QuantityTestCase):
             ],
         )
 
+    def test_compile_pattern(self):
+        ureg = self.ureg
+        pattern = ureg.compile_pattern("{foot}'{inch}")
+        self.assertEqual(
+            pattern("10'11"), [ureg.Quantity(10.0, "foot"), ureg.Quantity(11.0, "inch")]
+        )
+        self.assertEqual(
+            pattern("10'10 or 10'11", many=True),
+            ureg.parse_pattern("10'10 or 10'11", "{foot}'{inch}", many=True),
+        )
+        self.assertIsNone(pattern("no match"))
+        self.assertEqual(pattern("", many=True), [])
+
+        pattern = ureg.compile_pattern("{kilometer} km|{m} m")
+        self.assertEqual(pattern("3 km"), [ureg.Quantity(3.0, "km")])
+
+    @helpers.requires_numpy()
+    def test_compile_pattern_parse_many(self):
+        ureg = self.ureg
+        pattern = ureg.compile_pattern(r"{foot} ft( {inch} in)?")
+        results = pattern.parse_many(
+            ["5 ft 11 in", "no match", "6 ft", "x=-1.5 ft 2 in"]
+        )
+        self.assertEqual(sorted(results), ["foot", "inch"])
+        self.assertQuantityEqual(
+            results["foot"], ureg.Quantity(np.array([5.0, np.nan, 6.0, -1.5]), "foot")
+        )
+        self.assertQuantityEqual(
+            results["inch"],
+            ureg.Quantity(np.array([11.0, np.nan, np.nan, 2.0]), "inch"),
+        )
+
+        results = pattern.parse_many([])
+        self.assertEqual(results["foot"].magnitude.shape, (0,))
+
     def test_case_sensitivity(self):
         ureg = self.ureg
         # Default
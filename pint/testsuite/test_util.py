@@ -2,9 +2,14 @@ import collections
 import copy
 import math
 import operator as op
+import pickle
+import random
+import tokenize
 
 from pint.testsuite import BaseTestCase, QuantityTestCase
 from pint.util import (
+    AffixTrie,
+    LRUCache,
     ParserHelper,
     UnitsContainer,
     find_connected_nodes,
@@ -14,6 +19,7 @@ from pint.util import (
     sized,
     string_preprocessor,
     to_units_container,
+    tokenize_expression,
     tokenizer,
     transpose,
 )
@@ -112,6 +118,40 @@ class TestUnitsContainer(QuantityTestCase):
         self.assertEqual(y, "second")
         self.assertEqual(z, "meter/second/second")
 
+    def test_pickle(self):
+        x = UnitsContainer(meter=1, second=-2)
+        hash(x)
+        y = pickle.loads(pickle.dumps(x))
+        # The cached hash is recomputed in the unpickling process
+        self.assertIsNone(y._hash)
+        self.assertEqual(x, y)
+        self.assertEqual(hash(x), hash(y))
+
+    def test_intern(self):
+        x = UnitsContainer(meter=1, second=-2).intern()
+        y = UnitsContainer(second=-2, meter=1).intern()
+        self.assertIs(x, y)
+        self.assertIs(x.intern(), x)
+        # Exponents of different types are not merged
+        m = UnitsContainer(meter=1).intern()
+        self.assertIsNot(m ** 2, m ** 2.0)
+        self.assertEqual(m ** 2, m ** 2.0)
+        self.assertIsNot(UnitsContainer(meter=1.0).intern(), UnitsContainer(meter=1))
+
+        s = UnitsContainer(second=1).intern()
+        self.assertIs(x * s, x * s)
+        self.assertIs(x * s, UnitsContainer(meter=1, second=-1).intern())
+        self.assertIs(x / s, UnitsContainer(meter=1, second=-3).intern())
+        self.assertIs(x ** 2, UnitsContainer(meter=2, second=-4).intern())
+        self.assertIsInstance((x ** 2.0)["meter"], float)
+
+        # Operations on copies are not memoized, nor affect the interned instance
+        z = x.copy() * s
+        self.assertIsNot(z, x * s)
+        self.assertEqual(z, x * s)
+        self.assertEqual(x, UnitsContainer(meter=1, second=-2))
+        self.assertFalse(pickle.loads(pickle.dumps(x))._interned)
+
     def test_invalid(self):
         self.assertRaises(TypeError, UnitsContainer, {1: 2})
         self.assertRaises(TypeError, UnitsContainer, {"1": "2"})
@@ -267,6 +307,98 @@ class TestStringProcessor(BaseTestCase):
         self._test("water_60F", "water_60F")
 
 
+class TestTokenizeExpression(BaseTestCase):
+    PIECES = (
+        ["m", "km", "x1", "a_", "e", "E", "ex", "Ee", "j", "per", "per ", " per"]
+        + ["0", "00", "01", "2", "2.", "1.5", ".5", "e5", "e+5", "1e5", "1e-3"]
+        + [" ", "  ", "+", "-", "*", "**", "/", "//", "^", "(", ")", "_", "."]
+        + ["²", "²³", "⁻", "⁻²", "¹.⁵", "·", ",", "°", "sq", "squared", "\t"]
+    )
+
+    @staticmethod
+    def _tokens(func, input_string):
+        try:
+            return [
+                (token.type, token.string)
+                for token in func(input_string)
+                if token.type
+                in (tokenize.NAME, tokenize.NUMBER, tokenize.OP, tokenize.ENDMARKER)
+            ]
+        except Exception as e:
+            return type(e)
+
+    def _test(self, input_string):
+        self.assertEqual(
+            self._tokens(tokenize_expression, input_string),
+            self._tokens(lambda s: tokenizer(string_preprocessor(s)), input_string),
+            input_string,
+        )
+
+    def test_expressions(self):
+        for input_string in (
+            "meter",
+            "9.81 meter / second ** 2",
+            "kg m^2 s^-2 per K",
+            "1.2E+24hour",
+            "1e5j",
+            "1,000 m",
+            "m²·s⁻¹",
+            "m² s⁻²",
+            "(m / s",
+            "1 - 2",
+            "miles  per  hour",
+            "m per per s",
+            "cubic meter",
+        ):
+            with self.subTest(input_string):
+                self._test(input_string)
+
+    def test_random_expressions(self):
+        rnd = random.Random(0)
+        for _ in range(2000):
+            self._test("".join(rnd.choices(self.PIECES, k=rnd.randint(1, 8))))
+
+
+class TestAffixTrie(BaseTestCase):
+    def test_prefixes(self):
+        trie = AffixTrie(["", "k", "kilo", "m", "ki"])
+        self.assertEqual(trie.matches("kilometer"), ["", "k", "kilo", "ki"])
+        self.assertEqual(trie.matches("meter"), ["", "m"])
+        self.assertEqual(trie.matches("x"), [""])
+        trie.add("kilom")
+        trie.add("k")
+        self.assertEqual(trie.matches("kilometer"), ["", "k", "kilo", "ki", "kilom"])
+
+    def test_suffixes(self):
+        trie = AffixTrie(["", "s", "es"], reverse=True)
+        self.assertEqual(trie.matches("inches"), ["", "s", "es"])
+        self.assertEqual(trie.matches("meter"), [""])
+        self.assertEqual(AffixTrie(reverse=True).matches("meter"), [])
+
+
+class TestLRUCache(BaseTestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)
+        cache["c"] = 3
+        self.assertEqual(dict(cache), {"a": 1, "c": 3})
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("b", 0), 0)
+        self.assertRaises(ValueError, LRUCache, -1)
+
+    def test_pinned(self):
+        cache = LRUCache(1, {"a": 1, "b": 2})
+        cache["c"] = 3
+        cache["d"] = 4
+        cache["a"] = 5
+        self.assertEqual(dict(cache), {"a": 5, "b": 2, "d": 4})
+        self.assertEqual(len(cache), 3)
+        del cache["a"]
+        self.assertNotIn("a", cache)
+
+
 class TestGraph(BaseTestCase):
     def test_start_not_in_graph(self):
         g = collections.defaultdict(set)
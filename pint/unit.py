@@ -34,7 +34,9 @@ class Unit(PrettyIPython, SharedRegistryObject):
 
     def __init__(self, units):
         super().__init__()
-        if isinstance(units, (UnitsContainer, UnitDefinition)):
+        if isinstance(units, UnitsContainer):
+            self._units = units.intern()
+        elif isinstance(units, UnitDefinition):
             self._units = units
         elif isinstance(units, str):
             self._units = self._REGISTRY.parse_units(units)._units
@@ -164,12 +166,13 @@ class Unit(PrettyIPython, SharedRegistryObject):
             except DimensionalityError:
                 return False
 
+        get_vector = self._REGISTRY._get_dimensionality_vector
         if isinstance(other, (self._REGISTRY.Quantity, self._REGISTRY.Unit)):
-            return self.dimensionality == other.dimensionality
+            return get_vector(self._units) == get_vector(other._units)
 
         if isinstance(other, str):
-            return (
-                self.dimensionality == self._REGISTRY.parse_units(other).dimensionality
+            return get_vector(self._units) == get_vector(
+                self._REGISTRY.parse_units(other)._units
             )
 
         return self.dimensionless
@@ -179,13 +182,13 @@ class Unit(PrettyIPython, SharedRegistryObject):
             if isinstance(other, self.__class__):
                 return self.__class__(self._units * other._units)
             else:
-                qself = self._REGISTRY.Quantity(1, self._units)
+                qself = self._REGISTRY.Quantity._from_trusted(1, self._units)
                 return qself * other
 
         if isinstance(other, Number) and other == 1:
             return self._REGISTRY.Quantity(other, self._units)
 
-        return self._REGISTRY.Quantity(1, self._units) * other
+        return self._REGISTRY.Quantity._from_trusted(1, self._units) * other
 
     __rmul__ = __mul__
 
@@ -230,10 +233,10 @@ class Unit(PrettyIPython, SharedRegistryObject):
             if isinstance(other, self.__class__):
                 return self._units == other._units
             else:
-                return other == self._REGISTRY.Quantity(1, self._units)
+                return other == self._REGISTRY.Quantity._from_trusted(1, self._units)
 
         elif isinstance(other, NUMERIC_TYPES):
-            return other == self._REGISTRY.Quantity(1, self._units)
+            return other == self._REGISTRY.Quantity._from_trusted(1, self._units)
 
         else:
             return self._units == other
@@ -257,13 +260,13 @@ class Unit(PrettyIPython, SharedRegistryObject):
     __gt__ = lambda self, other: self.compare(other, op=operator.gt)
 
     def __int__(self):
-        return int(self._REGISTRY.Quantity(1, self._units))
+        return int(self._REGISTRY.Quantity._from_trusted(1, self._units))
 
     def __float__(self):
-        return float(self._REGISTRY.Quantity(1, self._units))
+        return float(self._REGISTRY.Quantity._from_trusted(1, self._units))
 
     def __complex__(self):
-        return complex(self._REGISTRY.Quantity(1, self._units))
+        return complex(self._REGISTRY.Quantity._from_trusted(1, self._units))
 
     __array_priority__ = 17
 
@@ -286,7 +289,9 @@ class Unit(PrettyIPython, SharedRegistryObject):
         if ufunc.__name__ in ("true_divide", "divide", "floor_divide", "multiply"):
             return ufunc(
                 *tuple(
-                    self._REGISTRY.Quantity(1, self._units) if arg is self else arg
+                    self._REGISTRY.Quantity._from_trusted(1, self._units)
+                    if arg is self
+                    else arg
                     for arg in inputs
                 ),
                 **kwargs,
@@ -12,12 +12,16 @@ import logging
 import math
 import operator
 import re
-from collections.abc import Mapping
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from fractions import Fraction
 from functools import lru_cache, partial
 from logging import NullHandler
 from numbers import Number
-from token import NAME, NUMBER
+from token import ENDMARKER, NAME, NUMBER, OP
+from tokenize import TokenInfo
+from types import MemberDescriptorType
 
 from .compat import NUMERIC_TYPES, tokenizer
 from .errors import DefinitionSyntaxError
@@ -293,6 +297,131 @@ def find_connected_nodes(graph, start, visited=None):
     return visited
 
 
+class AffixTrie:
+    """A trie of strings, used to find which of them are a prefix (or, if reverse
+    is True, a suffix) of a given string in time linear in the length of that string.
+
+    Parameters
+    ----------
+    words : iterable of str
+        initial content of the trie.
+    reverse : bool
+        if True, match suffixes instead of prefixes. (Default value = False)
+    """
+
+    #: Key of a trie node holding the insertion index of the word ending there.
+    _END = None
+
+    def __init__(self, words=(), reverse=False):
+        self._root = {}
+        self._count = 0
+        self._reverse = reverse
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        """Add a word to the trie. Adding an existing word does not change its
+        position in the insertion order.
+        """
+        node = self._root
+        for char in reversed(word) if self._reverse else word:
+            node = node.setdefault(char, {})
+        if self._END not in node:
+            node[self._END] = self._count
+            self._count += 1
+
+    def matches(self, string):
+        """Return the words of the trie that start (or end) string,
+        in insertion order.
+
+        Parameters
+        ----------
+        string : str
+
+        Returns
+        -------
+        list of str
+        """
+        node = self._root
+        found = []
+        if self._END in node:
+            found.append((node[self._END], ""))
+
+        chars = reversed(string) if self._reverse else string
+        for length, char in enumerate(chars, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if self._END in node:
+                word = string[-length:] if self._reverse else string[:length]
+                found.append((node[self._END], word))
+
+        found.sort()
+        return [word for _, word in found]
+
+
+class LRUCache(MutableMapping):
+    """A mapping holding at most maxsize entries, discarding the least recently
+    used one when full. Pinned entries are never discarded and do not count
+    towards maxsize.
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of entries that are not pinned.
+    pinned : mapping or None
+        initial entries, that are never discarded. (Default value = None)
+    """
+
+    def __init__(self, maxsize, pinned=None):
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non negative integer")
+        self.maxsize = maxsize
+        self._pinned = dict(pinned or {})
+        self._data = OrderedDict()
+
+    def __getitem__(self, key):
+        try:
+            return self._pinned[key]
+        except KeyError:
+            pass
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._pinned:
+            self._pinned[key] = value
+            return
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def __delitem__(self, key):
+        try:
+            del self._pinned[key]
+        except KeyError:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._pinned or key in self._data
+
+    def __iter__(self):
+        # Iterate over a copy, as reading values reorders the entries.
+        yield from list(self._pinned)
+        yield from list(self._data)
+
+    def __len__(self):
+        return len(self._pinned) + len(self._data)
+
+    def __repr__(self):
+        return "<LRUCache(maxsize={}, pinned={}, entries={})>".format(
+            self.maxsize, len(self._pinned), len(self._data)
+        )
+
+
 class udict(dict):
     """Custom dict implementing __missing__."""
 
@@ -303,6 +432,27 @@ class udict(dict):
         return udict(self)
 
 
+#: Interned UnitsContainer instances, see UnitsContainer.intern
+_interned_containers = weakref.WeakValueDictionary()
+
+#: Memoized operations between interned UnitsContainer instances, mapping
+#: (operator, id(left), id(right)) or (operator, id(left), exponent, type) to
+#: (left, right, result). The operands are kept so that their ids are not reused.
+_interned_operations = {}
+
+#: Maximum number of memoized operations, the memo is emptied when full.
+_INTERNED_OPERATIONS_SIZE = 4096
+
+
+def _memoize_operation(key, left, right, result):
+    """Intern and remember the result of an operation between interned containers."""
+    result = result.intern()
+    if len(_interned_operations) >= _INTERNED_OPERATIONS_SIZE:
+        _interned_operations.clear()
+    _interned_operations[key] = (left, right, result)
+    return result
+
+
 class UnitsContainer(Mapping):
     """The UnitsContainer stores the product of units and their respective
     exponent and implements the corresponding operations.
@@ -319,7 +469,7 @@ class UnitsContainer(Mapping):
 
     """
 
-    __slots__ = ("_d", "_hash", "_one", "_non_int_type")
+    __slots__ = ("_d", "_hash", "_one", "_non_int_type", "_interned", "__weakref__")
 
     def __init__(self, *args, **kwargs):
         if args and isinstance(args[0], UnitsContainer):
@@ -344,10 +494,37 @@ class UnitsContainer(Mapping):
             if not isinstance(value, int) and not isinstance(value, self._non_int_type):
                 d[key] = self._non_int_type(value)
         self._hash = None
+        self._interned = False
 
     def copy(self):
         return self.__copy__()
 
+    def intern(self):
+        """Return the shared instance of the UnitsContainer equal to this one.
+
+        Interned instances must not be modified. Comparing an interned instance
+        to itself is an identity check, and the results of multiplying, dividing
+        and raising interned instances to a power are memoized.
+
+        Returns
+        -------
+        UnitsContainer
+        """
+        if self._interned or type(self) is not UnitsContainer:
+            return self
+
+        # Exponents of different types are kept apart, e.g. m ** 2 and m ** 2.0
+        key = (
+            self._non_int_type,
+            frozenset([(k, v, type(v)) for k, v in self._d.items()]),
+        )
+        try:
+            return _interned_containers[key]
+        except KeyError:
+            self._interned = True
+            _interned_containers[key] = self
+            return self
+
     def add(self, key, value):
         newval = self._d[key] + value
         new = self.copy()
@@ -417,10 +594,16 @@ class UnitsContainer(Mapping):
         return self._d, self._hash, self._one, self._non_int_type
 
     def __setstate__(self, state):
-        self._d, self._hash, self._one, self._non_int_type = state
+        # The cached hash is not reused: str hashes are salted per process, so it
+        # would be wrong when unpickling in a different interpreter.
+        self._d, _, self._one, self._non_int_type = state
+        self._hash = None
+        self._interned = False
 
     def __eq__(self, other):
-        if isinstance(other, UnitsContainer):
+        if self is other:
+            return True
+        elif isinstance(other, UnitsContainer):
             # UnitsContainer.__hash__(self) is not the same as hash(self); see
             # ParserHelper.__hash__ and __eq__.
             # Different hashes guarantee that the actual contents are different, but
@@ -458,6 +641,7 @@ class UnitsContainer(Mapping):
         out._hash = self._hash
         out._non_int_type = self._non_int_type
         out._one = self._one
+        out._interned = False
         return out
 
     def __mul__(self, other):
@@ -465,6 +649,14 @@ class UnitsContainer(Mapping):
             err = "Cannot multiply UnitsContainer by {}"
             raise TypeError(err.format(type(other)))
 
+        memoize = self._interned and other._interned
+        if memoize:
+            memo_key = ("*", id(self), id(other))
+            try:
+                return _interned_operations[memo_key][2]
+            except KeyError:
+                pass
+
         new = self.copy()
         for key, value in other.items():
             new._d[key] += value
@@ -472,6 +664,8 @@ class UnitsContainer(Mapping):
                 del new._d[key]
 
         new._hash = None
+        if memoize:
+            return _memoize_operation(memo_key, self, other, new)
         return new
 
     __rmul__ = __mul__
@@ -481,10 +675,20 @@ class UnitsContainer(Mapping):
             err = "Cannot power UnitsContainer by {}"
             raise TypeError(err.format(type(other)))
 
+        memoize = self._interned and type(other) in (int, float)
+        if memoize:
+            memo_key = ("**", id(self), other, type(other))
+            try:
+                return _interned_operations[memo_key][2]
+            except KeyError:
+                pass
+
         new = self.copy()
         for key, value in new._d.items():
             new._d[key] *= other
         new._hash = None
+        if memoize:
+            return _memoize_operation(memo_key, self, other, new)
         return new
 
     def __truediv__(self, other):
@@ -492,6 +696,14 @@ class UnitsContainer(Mapping):
             err = "Cannot divide UnitsContainer by {}"
             raise TypeError(err.format(type(other)))
 
+        memoize = self._interned and other._interned
+        if memoize:
+            memo_key = ("/", id(self), id(other))
+            try:
+                return _interned_operations[memo_key][2]
+            except KeyError:
+                pass
+
         new = self.copy()
         for key, value in other.items():
             new._d[key] -= value
@@ -499,6 +711,8 @@ class UnitsContainer(Mapping):
                 del new._d[key]
 
         new._hash = None
+        if memoize:
+            return _memoize_operation(memo_key, self, other, new)
         return new
 
     def __rtruediv__(self, other):
@@ -597,16 +811,17 @@ class ParserHelper(UnitsContainer):
         if not input_string:
             return cls(non_int_type=non_int_type)
 
-        input_string = string_preprocessor(input_string)
         if "[" in input_string:
+            input_string = string_preprocessor(input_string)
             input_string = input_string.replace("[", "__obra__").replace(
                 "]", "__cbra__"
             )
             reps = True
+            gen = tokenizer(input_string)
         else:
             reps = False
+            gen = tokenize_expression(input_string)
 
-        gen = tokenizer(input_string)
         ret = build_eval_tree(gen).evaluate(
             partial(cls.eval_token, non_int_type=non_int_type)
         )
@@ -777,6 +992,184 @@ def string_preprocessor(input_string):
     return input_string
 
 
+#: Lexemes of the expressions handled by tokenize_expression.
+_lexeme_re = re.compile(
+    r"(?P<ws> +)"
+    r"|(?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?P<exp>[eE][+-]?[0-9]+)?)"
+    r"|(?P<name>[_a-zA-Z][_a-zA-Z0-9]*)"
+    r"|(?P<pretty>⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+(?:\.[⁰¹²³⁴⁵⁶⁷⁸⁹]*)?)"
+    r"|(?P<op>[-+*/^()·])"
+)
+#: Splits runs of operator characters as the Python tokenizer does.
+_op_re = re.compile(r"\*\*|//|.")
+#: Letters after which string_preprocessor inserts a "*" between a number and a name.
+_implicit_mul_letters = frozenset("abcdfghijklmnopqrstuvwxyzABCDFGHIJKLMNOPQRSTUVWXYZ")
+_ascii_letters = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def tokenize_expression(input_string):
+    """Split a unit expression into the tokens used by build_eval_tree.
+
+    This is a single pass equivalent of
+    ``tokenizer(string_preprocessor(input_string))``, which handles the usual
+    expressions made of ASCII names and numbers, operators, pretty exponents,
+    " per " and implicit multiplications. Other expressions are delegated to
+    the generic path.
+
+    Parameters
+    ----------
+    input_string : str
+
+    Returns
+    -------
+    list of tokenize.TokenInfo
+        NAME, NUMBER and OP tokens terminated by an ENDMARKER.
+    """
+    if "," in input_string:
+        input_string = input_string.replace(",", "")
+    if "sq" in input_string or "cub" in input_string:
+        # squared, cubed, cubic, square and sq are rewritten as exponents.
+        tokens = None
+    else:
+        tokens = _tokenize_expression(input_string)
+    if tokens is None:
+        return list(tokenizer(string_preprocessor(input_string)))
+    return tokens
+
+
+def _tokenize_expression(input_string):
+    """Implement tokenize_expression, returning None for unsupported expressions."""
+    if input_string.count("(") != input_string.count(")"):
+        # Let the generic path report the unbalanced parentheses.
+        return None
+
+    # The lexemes as [kind, text, start, size, match], where the size of a
+    # whitespace lexeme is the number of spaces not consumed by a " per ".
+    lexemes = []
+    pos = 0
+    end = len(input_string)
+    match = _lexeme_re.match
+    while pos < end:
+        m = match(input_string, pos)
+        if m is None:
+            return None
+        lexemes.append([m.lastgroup, m.group(), pos, m.end() - pos, m])
+        pos = m.end()
+
+    # " per " means "/", consuming one space on each side.
+    for i in range(1, len(lexemes) - 1 if "per" in input_string else 1):
+        lexeme = lexemes[i]
+        if (
+            lexeme[1] == "per"
+            and lexeme[0] == "name"
+            and lexemes[i - 1][0] == "ws"
+            and lexemes[i - 1][3]
+            and lexemes[i + 1][0] == "ws"
+        ):
+            lexeme[0] = "op"
+            lexeme[1] = "/"
+            lexemes[i - 1][3] -= 1
+            lexemes[i + 1][3] -= 1
+
+    tokens = []
+    ops = []
+    pretty_exps = []
+    last = len(lexemes) - 1
+
+    def flush_ops():
+        op_pos = ops[0][1]
+        for op in _op_re.findall("".join([op for op, _ in ops])):
+            tokens.append(
+                TokenInfo(OP, op, (1, op_pos), (1, op_pos + len(op)), input_string)
+            )
+        ops.clear()
+
+    for i, (kind, text, start, size, m) in enumerate(lexemes):
+        if kind == "ws":
+            if not size:
+                continue
+            if ops:
+                flush_ops()
+            # Spaces between two words are a multiplication.
+            if i and i < last:
+                prev_kind, prev_text = lexemes[i - 1][:2]
+                next_kind, next_text = lexemes[i + 1][:2]
+                if (prev_kind in ("name", "number", "pretty") or prev_text == "-") and (
+                    next_kind == "name" or next_kind == "number" and next_text[0] != "."
+                ):
+                    ops.append(("*", start))
+        elif kind == "op":
+            if text == "^":
+                text = "**"
+            elif text == "·":
+                text = "*"
+            ops.append((text, start))
+        elif kind == "name":
+            if ops:
+                flush_ops()
+            tokens.append(
+                TokenInfo(NAME, text, (1, start), (1, start + size), input_string)
+            )
+        elif kind == "number":
+            if ops:
+                flush_ops()
+            if len(text) > 1 and text[0] == "0" and text.isdigit() and text.strip("0"):
+                # Python tokenizes 012 as 0 and 12
+                return None
+            tokens.append(
+                TokenInfo(NUMBER, text, (1, start), (1, start + size), input_string)
+            )
+            if i < last:
+                following = lexemes[i + 1]
+                if following[0] != "name":
+                    continue
+                word = following[1]
+                if word[0] == "_":
+                    # Part of the number, e.g. 1_000
+                    return None
+                exp = m.group("exp")
+                if exp is None or exp[1] in "+-":
+                    # A number followed by letters is a multiplication,
+                    # unless the letters could be an exponent.
+                    if word[0] in _implicit_mul_letters or (
+                        len(word) > 1 and word[0] in "eE" and word[1] in _ascii_letters
+                    ):
+                        ops.append(("*", start + size))
+                elif word[0] in "jJ":
+                    # Imaginary number
+                    return None
+        else:
+            # Pretty exponent, which must follow an operand and be followed
+            # by an operator or a space.
+            if not i or not (
+                lexemes[i - 1][0] in ("name", "number") or lexemes[i - 1][1] == ")"
+            ):
+                return None
+            if i < last and lexemes[i + 1][0] in ("name", "number", "pretty"):
+                return None
+            # string_preprocessor replaces each exponent everywhere in the string,
+            # so it mangles exponents containing a previous one.
+            for previous in pretty_exps:
+                if previous != text and previous in text:
+                    return None
+            pretty_exps.append(text)
+            exp = text.translate(_pretty_table)
+            ops.append(("**", start))
+            if exp[0] == "-":
+                ops.append(("-", start))
+                exp = exp[1:]
+            flush_ops()
+            tokens.append(
+                TokenInfo(NUMBER, exp, (1, start), (1, start + size), input_string)
+            )
+
+    if ops:
+        flush_ops()
+
+    tokens.append(TokenInfo(ENDMARKER, "", (1, end), (1, end), input_string))
+    return tokens
+
+
 def _is_dim(name):
     return name[0] == "[" and name[-1] == "]"
 
@@ -795,11 +1188,16 @@ class SharedRegistryObject:
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, *args, **kwargs):
         inst = object.__new__(cls)
-        if not hasattr(cls, "_REGISTRY"):
+        if isinstance(
+            getattr(cls, "_REGISTRY", None), (type(None), MemberDescriptorType)
+        ):
             # Base class, not subclasses dynamically by
-            # UnitRegistry._init_dynamic_classes
+            # UnitRegistry._init_dynamic_classes. Slotted classes
+            # expose the _REGISTRY slot of the instance here.
             from . import _APP_REGISTRY
 
             inst._REGISTRY = _APP_REGISTRY
@@ -836,6 +1234,8 @@ class SharedRegistryObject:
 class PrettyIPython:
     """Mixin to add pretty-printers for IPython"""
 
+    __slots__ = ()
+
     def _repr_html_(self):
         if "~" in self.default_format:
             return "{:~H}".format(self)